@@ -1,13 +1,24 @@
 """Script to analyze the new UNIFORMES.xlsx structure."""
+import zipfile
+import xml.etree.ElementTree as ET
+
 import pandas as pd
 import openpyxl
 
+
+def read_merged_ranges(path, ws):
+    """Stream <mergeCell> refs from the sheet XML (read-only sheets don't expose them)."""
+    with zipfile.ZipFile(path) as zf, zf.open(ws._worksheet_path) as fh:
+        return [el.get('ref') for _, el in ET.iterparse(fh) if el.tag.endswith('}mergeCell')]
+
+
 file_path = 'sources/UNIFORMES.xlsx'
 print('ANALYZING:', file_path)
 print('=' * 80)
 
-# Load with openpyxl for detailed structure
-wb = openpyxl.load_workbook(file_path, data_only=True)
+# Load with openpyxl in read-only mode (streams cells instead of building the full DOM);
+# sheet sizes then come from each sheet's <dimension> tag without reading any cells
+wb = openpyxl.load_workbook(file_path, data_only=True, read_only=True, keep_links=False)
 print(f'\n📋 WORKSHEETS ({len(wb.sheetnames)}):')
 for i, sheet_name in enumerate(wb.sheetnames, 1):
     ws = wb[sheet_name]
@@ -16,41 +27,36 @@ for i, sheet_name in enumerate(wb.sheetnames, 1):
 # Analyze first sheet in detail
 ws = wb.active
 print(f'\n📊 Active sheet: "{ws.title}"')
-print(f'Dimensions: {ws.dimensions}')
+print(f'Dimensions: {ws.calculate_dimension()}')
 
 # Show first 15 rows with all columns
 print('\n' + '=' * 80)
 print('FIRST 15 ROWS (columns A-T):')
 print('=' * 80)
-for row_idx in range(1, min(16, ws.max_row + 1)):
-    row_data = []
-    for col_idx in range(1, min(21, ws.max_column + 1)):
-        cell = ws.cell(row=row_idx, column=col_idx)
-        val = cell.value
-        if val is not None:
-            val_str = str(val)[:20]
-        else:
-            val_str = ''
-        row_data.append(val_str)
+preview_rows = ws.iter_rows(min_row=1, max_row=15, max_col=20, values_only=True)
+for row_idx, row in enumerate(preview_rows, 1):
+    row_data = ['' if val is None else str(val)[:20] for val in row]
     print(f'Row {row_idx:2d}: ' + ' | '.join(row_data))
 
 # Column headers analysis
 print('\n' + '=' * 80)
 print('ALL COLUMN HEADERS:')
 print('=' * 80)
-for col_idx in range(1, ws.max_column + 1):
-    col_letter = openpyxl.utils.get_column_letter(col_idx)
-    # Check rows 1-5 for header content
-    for row in range(1, 6):
-        cell = ws.cell(row=row, column=col_idx)
-        if cell.value:
-            print(f'  {col_letter} (col {col_idx}, row {row}): {cell.value}')
+# Check rows 1-5 for header content, walking the streamed rows column-wise
+header_rows = list(ws.iter_rows(min_row=1, max_row=5, max_col=ws.max_column, values_only=True))
+col_letters = [openpyxl.utils.get_column_letter(i) for i in range(1, ws.max_column + 1)]
+for col_idx, column in enumerate(zip(*header_rows), 1):
+    col_letter = col_letters[col_idx - 1]
+    for row, val in enumerate(column, 1):
+        if val:
+            print(f'  {col_letter} (col {col_idx}, row {row}): {val}')
             break
 
 # Merged cells
 print('\n📦 MERGED CELLS:')
-if ws.merged_cells.ranges:
-    for merged_range in list(ws.merged_cells.ranges)[:20]:
+merged_ranges = read_merged_ranges(file_path, ws)
+if merged_ranges:
+    for merged_range in merged_ranges[:20]:
         print(f'  {merged_range}')
 else:
     print('  None')
@@ -59,7 +65,7 @@ else:
 print('\n' + '=' * 80)
 print('PANDAS DATA VIEW:')
 print('=' * 80)
-df = pd.read_excel(file_path, header=None)
+df = pd.read_excel(file_path, header=None, nrows=20, engine='calamine')
 print(df.head(20).to_string())
 
 print('\n' + '=' * 80)
@@ -7,14 +7,14 @@ def analyze_uniformes(file_path: str):
     """Read rows 6,7,8 from sheets to see job names."""
     print(f"=== ANALYZING {file_path} ===")
     
-    with pd.ExcelFile(file_path) as excel:
+    with pd.ExcelFile(file_path, engine='calamine') as excel:
         print(f"\nSheets: {excel.sheet_names}")
         
         for sheet in ['MIRAFLORES', 'TARAPOTO']:
             if sheet in excel.sheet_names:
                 print(f"\n--- Sheet: {sheet} ---")
                 # Read header rows
-                df = pd.read_excel(excel, sheet_name=sheet, header=None, nrows=10)
+                df = pd.read_excel(excel, sheet_name=sheet, header=None, nrows=10, usecols=range(25))
                 print(f"Rows 6-8 (0-indexed 5-7):")
                 for i in range(5, 8):
                     if i < len(df):
@@ -27,7 +27,9 @@ def analyze_precios(file_path: str):
     """Get unique occupations from precios.xlsx."""
     print(f"\n=== ANALYZING {file_path} ===")
     
-    df = pd.read_excel(file_path, sheet_name='Precios', header=0)
+    df = pd.read_excel(file_path, sheet_name='Precios', header=0, engine='calamine')
+    # calamine keeps formatted-but-empty trailing rows that openpyxl skips
+    df = df.dropna(how='all')
     
     print(f"\nUnique CARGO ESTANDAR ({df['CARGO ESTANDAR'].nunique()}):")
     for cargo in sorted(df['CARGO ESTANDAR'].unique()):
@@ -39,22 +41,16 @@ def analyze_precios(file_path: str):
     
     # Find gendered materials
     print(f"\nGendered MATERIALS (containing HOMBRE or MUJER):")
-    for mat in sorted(df['MATERIAL'].unique()):
-        mat_upper = str(mat).upper()
-        if 'HOMBRE' in mat_upper or 'MUJER' in mat_upper:
-            print(f"  - {mat}")
+    materials = pd.Series(df['MATERIAL'].unique())
+    gendered = materials[materials.astype(str).str.upper().str.contains('HOMBRE|MUJER')]
+    for mat in sorted(gendered):
+        print(f"  - {mat}")
     
     # Find materials with BLUSA (female) vs CAMISA (male)
     print(f"\nGendered by type (BLUSA=female, CAMISA=male):")
-    blusa_cargos = set()
-    camisa_cargos = set()
-    for _, row in df.iterrows():
-        mat = str(row['MATERIAL']).upper()
-        cargo = row['CARGO ESTANDAR']
-        if 'BLUSA' in mat:
-            blusa_cargos.add(cargo)
-        if 'CAMISA' in mat:
-            camisa_cargos.add(cargo)
+    mat_upper = df['MATERIAL'].astype(str).str.upper()
+    blusa_cargos = set(df.loc[mat_upper.str.contains('BLUSA', regex=False), 'CARGO ESTANDAR'].unique())
+    camisa_cargos = set(df.loc[mat_upper.str.contains('CAMISA', regex=False), 'CARGO ESTANDAR'].unique())
     
     print(f"  BLUSA occupations: {blusa_cargos}")
     print(f"  CAMISA occupations: {camisa_cargos}")
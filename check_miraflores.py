@@ -1,40 +1,53 @@
 """Analyze MIRAFLORES sheet for all occupations"""
+from functools import lru_cache
 import pandas as pd
-import json
-
-# Load the MIRAFLORES sheet
-df = pd.read_excel('sources/pruebitaaaaa uniformes} (2).xlsx', 
-                   sheet_name='MIRAFLORES', header=7, engine='openpyxl')
-
-print('=== MIRAFLORES Sheet Analysis ===')
-print(f'Total rows: {len(df)}')
-print(f'Columns: {list(df.columns)[:10]}')
-
-# Get all unique CARGOs
-if 'CARGO' in df.columns:
-    cargos = df['CARGO'].dropna().unique()
-    print(f'\nAll unique CARGOs ({len(cargos)}):')
-    for cargo in sorted(cargos):
-        count = len(df[df['CARGO'] == cargo])
-        print(f'  - {cargo} ({count} rows)')
-
-# Load config for mapping check
-with open('config.json', 'r') as f:
-    config = json.load(f)
-
-config_occs = set()
-config_synonyms = {}
-for occ in config.get('occupations', []):
-    config_occs.add(occ['name'].upper())
-    for syn in occ.get('synonyms', []):
-        config_synonyms[syn.upper()] = occ['name']
-
-print('\n=== MAPPING CHECK ===')
-for cargo in sorted(cargos):
-    upper = str(cargo).upper().strip()
-    if upper in config_occs:
-        print(f'  ✅ {cargo:30} -> DIRECT')
-    elif upper in config_synonyms:
-        print(f'  ✅ {cargo:30} -> {config_synonyms[upper]}')
-    else:
-        print(f'  ❌ {cargo:30} -> NOT FOUND (will get 0.0 price)')
+
+from config_index import CONFIG_PATH, load_config_index
+
+EXCEL_PATH = 'sources/pruebitaaaaa uniformes} (2).xlsx'
+
+
+@lru_cache(maxsize=None)
+def load_miraflores(path: str = EXCEL_PATH) -> pd.DataFrame:
+    """Load the MIRAFLORES sheet; cached so repeated checks reuse the parse."""
+    return pd.read_excel(path, sheet_name='MIRAFLORES', header=7, engine='calamine')
+
+
+def main(config_path=CONFIG_PATH, excel_path: str = EXCEL_PATH):
+    """Print the MIRAFLORES cargo counts and their config.json mapping."""
+    # Load the MIRAFLORES sheet
+    df = load_miraflores(excel_path)
+
+    print('=== MIRAFLORES Sheet Analysis ===')
+    print(f'Total rows: {len(df)}')
+    print(f'Columns: {list(df.columns)[:10]}')
+
+    # Get all unique CARGOs
+    if 'CARGO' in df.columns:
+        # One hash-count pass instead of re-filtering the sheet per cargo
+        counts = df['CARGO'].value_counts(dropna=True)
+        cargos = counts.index
+        print(f'\nAll unique CARGOs ({len(cargos)}):')
+        for cargo in sorted(cargos):
+            print(f'  - {cargo} ({counts[cargo]} rows)')
+
+    # Load config for mapping check
+    config_index = load_config_index(config_path)
+    config_occs = config_index['occ_name_set']
+    config_synonyms = config_index['synonym_map']
+
+    # Resolve all cargos in one vectorized map; direct names take precedence over synonyms
+    mapper = {**config_synonyms, **{occ: 'DIRECT' for occ in config_occs}}
+    sorted_cargos = sorted(cargos)
+    mapped = pd.Series(sorted_cargos, dtype=object).astype(str).str.upper().str.strip().map(mapper)
+
+    print('\n=== MAPPING CHECK ===')
+    for cargo, target, not_found in zip(sorted_cargos, mapped, mapped.isna()):
+        if not_found:
+            print(f'  ❌ {cargo:30} -> NOT FOUND (will get 0.0 price)')
+        else:
+            print(f'  ✅ {cargo:30} -> {target}')
+
+
+if __name__ == '__main__':
+    main()
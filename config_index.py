@@ -0,0 +1,64 @@
+"""
+Shared config.json loading for the helper scripts.
+
+The occupation index (names, synonyms) is cached as a pickle next to the
+config and rebuilt only when config.json changes.
+"""
+import pickle
+import sys
+from pathlib import Path
+
+import orjson
+
+sys.path.append(str(Path(__file__).parent / 'src'))
+from cargos.services.config_manager import from_file_layout
+
+CONFIG_PATH = Path('config.json')
+CACHE_PATH = Path('.cache/config_index.pkl')
+
+
+def load_config(config_path=CONFIG_PATH) -> dict:
+    """Parse config.json with orjson, expanding column-wise prendas to dicts."""
+    return from_file_layout(orjson.loads(Path(config_path).read_bytes()))
+
+
+def build_config_index(config: dict) -> dict:
+    """Build the occupation lookups the scripts share."""
+    occupation_names = []
+    occ_name_set = set()
+    synonym_map = {}
+    for occ in config.get('occupations', []):
+        occupation_names.append(occ['name'])
+        occ_name_set.add(occ['name'].upper())
+        for syn in occ.get('synonyms', []):
+            synonym_map[syn.upper()] = occ['name']
+    return {
+        'occupation_names': occupation_names,
+        'occ_name_set': occ_name_set,
+        'synonym_map': synonym_map,
+    }
+
+
+def load_config_index(config_path=CONFIG_PATH, cache_path=CACHE_PATH) -> dict:
+    """Return the occupation index, reusing the pickle while config.json is unchanged."""
+    config_path = Path(config_path)
+    cache_path = Path(cache_path)
+    stat = config_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('stamp') == stamp:
+            return cached['index']
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError):
+        pass
+
+    index = build_config_index(load_config(config_path))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump({'stamp': stamp, 'index': index}, f, protocol=5)
+    except OSError:
+        pass  # Cache is best-effort
+    return index
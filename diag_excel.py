@@ -1,13 +1,14 @@
 
-import pandas as pd
-import numpy as np
+from python_calamine import CalamineWorkbook
 
 file_path = 'sources/informacion-uniformes.xlsx'
-df = pd.read_excel(file_path, sheet_name='miraflores', header=None)
+# Only the first 100 rows are inspected below; plain row lists, no DataFrame
+sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_name('miraflores')
+rows = sheet.to_python(skip_empty_area=False, nrows=100)
 
 # Headers are at Row 8 (Index 7)
-headers = df.iloc[7].tolist()
-occupations = df.iloc[6].tolist()
+headers = rows[7]
+occupations = rows[6]
 
 print(f"{'NAME':<30} | {'CARGO':<20} | {'NON-ZERO COLS'}")
 print("-" * 80)
@@ -20,7 +21,8 @@ target_names = [
     'HUAMAN GARCIA CESAR ENRIQUE'
 ]
 
-for idx, row in df.iloc[8:100].iterrows():
+# calamine returns '' for empty cells
+for row in rows[8:100]:
     name = str(row[2]).strip()
     cargo = str(row[3]).strip()
     
@@ -36,7 +38,9 @@ for idx, row in df.iloc[8:100].iterrows():
         non_zeros = []
         for col_idx in range(9, 71):
             val = row[col_idx]
-            if pd.notna(val) and val != 0:
+            if val != '' and val != 0:
+                if isinstance(val, float) and val.is_integer():
+                    val = int(val)  # calamine yields floats for all numbers
                 item_name = str(headers[col_idx])
                 occ_group = str(occupations[col_idx])
                 non_zeros.append(f"[{col_idx}] {occ_group}/{item_name}={val}")
@@ -45,14 +49,14 @@ for idx, row in df.iloc[8:100].iterrows():
 
 print("\n=== CHECKING OFFSET DISCREPANCY ===")
 # Let's check a few generic rows to see if people have values in columns matching their CARGO
-for idx, row in df.iloc[8:30].iterrows():
+for row in rows[8:30]:
     name = str(row[2]).strip()
     cargo = str(row[3]).strip()
-    if cargo == 'nan' or name == 'nan': continue
+    if not cargo or not name: continue
     
     non_zeros = []
     for col_idx in range(9, 71):
-        if pd.notna(row[col_idx]) and row[col_idx] != 0:
+        if row[col_idx] != '' and row[col_idx] != 0:
             non_zeros.append(col_idx)
     
     print(f"{name:<30} | {cargo:<20} | Indices: {non_zeros}")
@@ -1,34 +1,69 @@
 """
 Script to extract prices from precios.xlsm and generate config.json updates
 """
+import re
+from functools import lru_cache
+from operator import itemgetter
 import pandas as pd
 import json
 from pathlib import Path
+from python_calamine import CalamineWorkbook
+
+PRICE_COLUMNS = ['GRUPO', 'CARGO ESTANDAR', 'MATERIAL', 'TALLA', 'Precio Unit']
+
+KNOWN_PRENDAS = {
+    'POLO': ['POLO'],
+    'CAMISA': ['CAMISA'],
+    'BLUSA': ['BLUSA'],
+    'CHAQUETA': ['CHAQUETA'],
+    'PANTALON': ['PANTALON', 'PANTALÓN'],
+    'PECHERA': ['PECHERA'],
+    'GARIBALDI': ['GARIBALDI'],
+    'MANDILON': ['MANDILON', 'MANDILÓN'],
+    'ANDARIN': ['ANDARIN'],
+    'SACO': ['SACO'],
+    'GORRA': ['GORRA', 'GORRO'],
+    'CASACA': ['CASACA'],
+}
+_PRENDA_PRIORITY = {prenda_type: i for i, prenda_type in enumerate(KNOWN_PRENDAS)}
+# One named group per prenda type, inside a lookahead so every keyword hit is reported
+_PRENDA_PATTERN = re.compile('(?=' + '|'.join(
+    f"(?P<{prenda_type}>{'|'.join(map(re.escape, keywords))})"
+    for prenda_type, keywords in KNOWN_PRENDAS.items()
+) + ')')
 
 def extract_prices(file_path: str = 'sources/precios.xlsm') -> dict:
     """Extract all unique prices from the Movimientos sheet."""
-    df = pd.read_excel(file_path, sheet_name='Movimientos', engine='openpyxl')
+    # Stream rows with calamine and keep only the price columns; the other
+    # columns of the sheet are never collected
+    sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_name('Movimientos')
+    rows = sheet.iter_rows()
+    header = next(rows)
+    pick_prices = itemgetter(*(header.index(col) for col in PRICE_COLUMNS))
     
-    # Get all unique prices
-    prices = df[['GRUPO', 'CARGO ESTANDAR', 'MATERIAL', 'TALLA', 'Precio Unit']].drop_duplicates()
-    prices = prices.sort_values(['GRUPO', 'CARGO ESTANDAR', 'MATERIAL', 'TALLA'])
+    # Get all unique prices (calamine returns '' for empty cells)
+    prices = pd.DataFrame(
+        [[None if val == '' else val for val in pick_prices(row)] for row in rows],
+        columns=PRICE_COLUMNS,
+    ).drop_duplicates()
+    # The last row of each key wins, as when overwriting row by row, even if its
+    # price is empty (GroupBy.last() would skip it); groupby then sorts the keys
+    price_keys = ['GRUPO', 'CARGO ESTANDAR', 'MATERIAL', 'TALLA']
+    flat_prices = (
+        prices.drop_duplicates(price_keys, keep='last')
+        .groupby(price_keys, dropna=False)['Precio Unit']
+        .first()
+        .astype(float)
+    )
+    
+    # Collapse the TALLA level into {talla: price} once per material
+    tallas_by_material = flat_prices.groupby(level=[0, 1, 2], sort=False, dropna=False)
     
     # Create a structured dict
     price_config = {}
-    for _, row in prices.iterrows():
-        grupo = row['GRUPO']
-        cargo = row['CARGO ESTANDAR']
-        material = row['MATERIAL']
-        talla = row['TALLA']
-        price = float(row['Precio Unit'])
-        
-        if grupo not in price_config:
-            price_config[grupo] = {}
-        if cargo not in price_config[grupo]:
-            price_config[grupo][cargo] = {}
-        if material not in price_config[grupo][cargo]:
-            price_config[grupo][cargo][material] = {}
-        price_config[grupo][cargo][material][talla] = price
+    for (grupo, cargo, material), tallas in tallas_by_material:
+        materials = price_config.setdefault(grupo, {}).setdefault(cargo, {})
+        materials[material] = dict(zip(tallas.index.get_level_values('TALLA'), tallas))
     
     return price_config
 
@@ -42,31 +77,12 @@ def print_prices(price_config: dict):
                 for talla, price in tallas.items():
                     print(f"    {material[:40]:42} | {talla:5} | S/{price}")
 
+@lru_cache(maxsize=None)
 def normalize_prenda_type(material: str) -> str:
     """Normalize material name to prenda type."""
-    material_upper = material.upper()
-    
-    known_prendas = {
-        'POLO': ['POLO'],
-        'CAMISA': ['CAMISA'],
-        'BLUSA': ['BLUSA'],
-        'CHAQUETA': ['CHAQUETA'],
-        'PANTALON': ['PANTALON', 'PANTALÓN'],
-        'PECHERA': ['PECHERA'],
-        'GARIBALDI': ['GARIBALDI'],
-        'MANDILON': ['MANDILON', 'MANDILÓN'],
-        'ANDARIN': ['ANDARIN'],
-        'SACO': ['SACO'],
-        'GORRA': ['GORRA', 'GORRO'],
-        'CASACA': ['CASACA'],
-    }
-    
-    for prenda_type, keywords in known_prendas.items():
-        for keyword in keywords:
-            if keyword in material_upper:
-                return prenda_type
-    
-    return 'OTHER'
+    # Single scan; types listed first in KNOWN_PRENDAS win, as before
+    found = {m.lastgroup for m in _PRENDA_PATTERN.finditer(material.upper())}
+    return min(found, key=_PRENDA_PRIORITY.__getitem__, default='OTHER')
 
 def generate_config_updates(price_config: dict) -> dict:
     """Generate config.json updates from price data."""
@@ -87,19 +103,15 @@ def generate_config_updates(price_config: dict) -> dict:
             # Normalize cargo name
             cargo_key = cargo.upper().replace(' / ', '_').replace(' ', '_')
             
-            if cargo_key not in updates:
-                updates[cargo_key] = {}
+            cargo_updates = updates.setdefault(cargo_key, {})
             
             for material, tallas in materials.items():
-                prenda_type = normalize_prenda_type(material)
-                
-                if prenda_type not in updates[cargo_key]:
-                    updates[cargo_key][prenda_type] = {}
+                prenda_updates = cargo_updates.setdefault(normalize_prenda_type(material), {})
                 
                 for talla, price in tallas.items():
                     talla_key = 'sml' if talla == 'SML' else ('xl' if talla == 'XL' else 'xxl')
                     price_key = f"price_{talla_key}_{loc_key}"
-                    updates[cargo_key][prenda_type][price_key] = price
+                    prenda_updates[price_key] = price
     
     return updates
 
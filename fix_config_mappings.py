@@ -3,11 +3,12 @@ Fix config.json occupation mappings:
 1. Add base synonyms (CAJA, STAFF ADMINISTRATIVO, ANFITRIONAJE) to gendered occupations
 2. Add missing occupations (AUDITORIA, COUNTER)
 """
-import json
+import orjson
+
+from config_index import CONFIG_PATH, load_config
 
 # Load config
-with open('config.json', 'r') as f:
-    config = json.load(f)
+config = load_config()
 
 # Track changes
 changes = []
@@ -33,9 +34,10 @@ for occ in config.get('occupations', []):
                 changes.append(f"Added synonym '{syn}' to {name}")
 
 # 2. Add missing occupations
+existing_names = {o['name'] for o in config['occupations']}
+
 # Check if AUDITORIA exists
-auditoria_exists = any(o['name'] == 'AUDITORIA' for o in config['occupations'])
-if not auditoria_exists:
+if 'AUDITORIA' not in existing_names:
     config['occupations'].append({
         "name": "AUDITORIA",
         "display_name": "Auditoría",
@@ -66,8 +68,7 @@ if not auditoria_exists:
     changes.append("Added occupation AUDITORIA")
 
 # Check if COUNTER exists
-counter_exists = any(o['name'] == 'COUNTER' for o in config['occupations'])
-if not counter_exists:
+if 'COUNTER' not in existing_names:
     config['occupations'].append({
         "name": "COUNTER",
         "display_name": "Counter",
@@ -115,9 +116,8 @@ if not counter_exists:
     })
     changes.append("Added occupation COUNTER")
 
-# Save updated config
-with open('config.json', 'w') as f:
-    json.dump(config, f, indent=2, ensure_ascii=False)
+# Save updated config (same layout as json.dump(indent=2, ensure_ascii=False))
+CONFIG_PATH.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
 print("=== CONFIG.JSON UPDATED ===\n")
 for change in changes:
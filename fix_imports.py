@@ -20,6 +20,13 @@ IMPORT_MAPPINGS = {
     r'^import validators$': 'from cargos.core import validators',
 }
 
+# All mappings compiled into one alternation; group gN maps to the Nth replacement
+IMPORT_PATTERN = re.compile(
+    '|'.join(f'(?P<g{i}>{pattern})' for i, pattern in enumerate(IMPORT_MAPPINGS)),
+    flags=re.MULTILINE,
+)
+IMPORT_REPLACEMENTS = list(IMPORT_MAPPINGS.values())
+
 def fix_file_imports(file_path: Path):
     """Fix imports in a single file."""
     if not file_path.exists():
@@ -28,9 +35,9 @@ def fix_file_imports(file_path: Path):
     content = file_path.read_text(encoding='utf-8')
     original_content = content
     
-    # Apply each mapping
-    for old_pattern, new_import in IMPORT_MAPPINGS.items():
-        content = re.sub(old_pattern, new_import, content, flags=re.MULTILINE)
+    # Apply all mappings in a single pass (files without imports can't match)
+    if 'import' in content:
+        content = IMPORT_PATTERN.sub(lambda m: IMPORT_REPLACEMENTS[int(m.lastgroup[1:])], content)
     
     # Write back if changed
     if content != original_content:
@@ -1,8 +1,9 @@
 
-import json
-import pandas as pd
 import logging
 import sys
+from python_calamine import CalamineWorkbook
+
+from config_index import load_config_index
 
 # Configure basic logging
 logging.basicConfig(level=logging.ERROR)
@@ -10,9 +11,7 @@ logging.basicConfig(level=logging.ERROR)
 def gather_info():
     # 1. Load Occupations from config
     try:
-        with open('config.json', 'r') as f:
-            config = json.load(f)
-        occupations = [o['name'] for o in config.get('occupations', [])]
+        occupations = load_config_index()['occupation_names']
         print(f"✅ Loaded {len(occupations)} Configured Occupations:")
         for occ in sorted(occupations):
             print(f"  - {occ}")
@@ -22,12 +21,14 @@ def gather_info():
     # 2. Load Excel Headers
     excel_path = 'sources/informacion-uniformes.xlsx'
     try:
-        df = pd.read_excel(excel_path, sheet_name='miraflores', header=None, nrows=10)
+        # Plain row lists straight from calamine; no DataFrame needed for two rows
+        sheet = CalamineWorkbook.from_path(excel_path).get_sheet_by_name('miraflores')
+        rows = sheet.to_python(skip_empty_area=False, nrows=10)
         
         # Row 7 (Index 6) - Occupation/Location Groups
-        occ_row = df.iloc[6].tolist()
+        occ_row = rows[6]
         # Row 8 (Index 7) - Items
-        item_row = df.iloc[7].tolist()
+        item_row = rows[7]
         
         print("\n✅ Excel Column Mapping (Columns J-BS / 9-70):")
         print(f"{'IDX':<4} | {'GROUP HEADER (Row 7)':<30} | {'ITEM HEADER (Row 8)':<20}")
@@ -38,7 +39,7 @@ def gather_info():
             val_group = str(occ_row[i]).strip()
             val_item = str(item_row[i]).strip()
             
-            if val_group != 'nan' and val_group != '':
+            if val_group:
                 current_group = val_group
             
             if i > 70: break # Stop at known end
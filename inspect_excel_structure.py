@@ -2,68 +2,72 @@
 Script to inspect the Excel file structure for hierarchical pricing.
 Analyzes rows 5, 6, and 7 to understand the location/occupation/prenda hierarchy.
 """
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from python_calamine import CalamineWorkbook
+
 # Read the Excel file without headers to see raw structure
 file_path = Path("sources/informacion-uniformes.xlsx")
 
+# Header rows + 5 sample rows are all we inspect
+PREVIEW_ROWS = 13
+
+
+def read_sheet_preview(sheet_name):
+    """Read one sheet's size and preview rows with its own calamine reader."""
+    sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_name(sheet_name)
+    return sheet.end, sheet.to_python(skip_empty_area=False, nrows=PREVIEW_ROWS)
+
+
+def print_header_row(rows, row_idx):
+    """Print the non-empty cells of a header row with their column letters."""
+    row = rows[row_idx] if len(rows) > row_idx else []
+    for col_idx, val in enumerate(row):
+        if str(val).strip():
+            col_letter = chr(65 + col_idx) if col_idx < 26 else f"A{chr(65 + col_idx - 26)}"
+            print(f"  Column {col_idx} ({col_letter}): {val}")
+
+
 print("=" * 80)
 print(f"Inspecting: {file_path}")
 print("=" * 80)
 
-# Read entire sheet without headers
-xl = pd.ExcelFile(file_path)
-print(f"\nSheets available: {xl.sheet_names}")
+sheet_names = CalamineWorkbook.from_path(file_path).sheet_names
+print(f"\nSheets available: {sheet_names}")
+
+# Sheets are independent, so read them concurrently
+with ThreadPoolExecutor() as executor:
+    previews = list(executor.map(read_sheet_preview, sheet_names[:2]))  # First 2 sheets
 
-for sheet_name in xl.sheet_names[:2]:  # First 2 sheets
+for sheet_name, ((last_row, last_col), rows) in zip(sheet_names, previews):
     print(f"\n{'='*80}")
     print(f"SHEET: {sheet_name}")
     print("=" * 80)
     
-    df = pd.read_excel(xl, sheet_name=sheet_name, header=None)
-    
-    # Show first 10 rows to understand structure
-    print(f"\nTotal rows: {len(df)}, Total columns: {len(df.columns)}")
+    print(f"\nTotal rows: {last_row + 1}, Total columns: {last_col + 1}")
     
     # Focus on rows 5, 6, 7 (0-indexed: 4, 5, 6) which contain location and occupation headers
     print("\n--- ROW 5 (0-indexed row 4) - Likely LOCATION GROUP headers ---")
-    row5 = df.iloc[4] if len(df) > 4 else pd.Series()
-    # Show non-empty values
-    for col_idx, val in enumerate(row5):
-        if pd.notna(val) and str(val).strip():
-            col_letter = chr(65 + col_idx) if col_idx < 26 else f"A{chr(65 + col_idx - 26)}"
-            print(f"  Column {col_idx} ({col_letter}): {val}")
+    print_header_row(rows, 4)
     
     print("\n--- ROW 6 (0-indexed row 5) - Likely OCCUPATION headers ---")
-    row6 = df.iloc[5] if len(df) > 5 else pd.Series()
-    for col_idx, val in enumerate(row6):
-        if pd.notna(val) and str(val).strip():
-            col_letter = chr(65 + col_idx) if col_idx < 26 else f"A{chr(65 + col_idx - 26)}"
-            print(f"  Column {col_idx} ({col_letter}): {val}")
+    print_header_row(rows, 5)
     
     print("\n--- ROW 7 (0-indexed row 6) - Likely PRENDA TYPE headers ---")
-    row7 = df.iloc[6] if len(df) > 6 else pd.Series()
-    for col_idx, val in enumerate(row7):
-        if pd.notna(val) and str(val).strip():
-            col_letter = chr(65 + col_idx) if col_idx < 26 else f"A{chr(65 + col_idx - 26)}"
-            print(f"  Column {col_idx} ({col_letter}): {val}")
+    print_header_row(rows, 6)
     
     print("\n--- ROW 8 (0-indexed row 7) - Likely DATA HEADERS (DNI, CARGO, etc.) ---")
-    row8 = df.iloc[7] if len(df) > 7 else pd.Series()
-    for col_idx, val in enumerate(row8):
-        if pd.notna(val) and str(val).strip():
-            col_letter = chr(65 + col_idx) if col_idx < 26 else f"A{chr(65 + col_idx - 26)}"
-            print(f"  Column {col_idx} ({col_letter}): {val}")
+    print_header_row(rows, 7)
     
     # Also show some data rows to see cargo values
     print("\n--- SAMPLE DATA ROWS (first 5) ---")
-    for row_idx in range(8, min(13, len(df))):
-        row_data = df.iloc[row_idx]
+    for row_idx in range(8, len(rows)):
+        row_data = rows[row_idx]
         # Get cargo column (usually around column 3)
-        cargo_val = row_data.iloc[3] if len(row_data) > 3 else ""
-        name_val = row_data.iloc[2] if len(row_data) > 2 else ""
-        tienda = row_data.iloc[1] if len(row_data) > 1 else ""
+        cargo_val = row_data[3] if len(row_data) > 3 else ""
+        name_val = row_data[2] if len(row_data) > 2 else ""
+        tienda = row_data[1] if len(row_data) > 1 else ""
         print(f"  Row {row_idx + 1}: Tienda={tienda}, Name={name_val}, Cargo={cargo_val}")
 
 print("\n" + "=" * 80)
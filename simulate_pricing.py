@@ -1,45 +1,94 @@
 """Dump quantities and pricing info for the test file"""
+import io
+from dataclasses import dataclass
+import numpy as np
+import openpyxl
 import pandas as pd
-import json
+from config_index import load_config
 import os
 import sys
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to einsum
+    njit = None
+
 # Simulation of ExcelService/UnifiedConfig logic
 def normalize_prenda_type(col_name):
-    parts = col_name.split("_")
-    # This matches the current logic in excel_service.py
-    if len(parts) >= 3:
-        return "_".join(parts[2:])
-    return col_name
+    # This matches the current logic in excel_service.py: drop the first two "_" parts
+    _, sep, tail = col_name.partition("_")
+    _, sep2, tail = tail.partition("_")
+    return tail if sep and sep2 else col_name
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def price_rows(Q, P):
+        """Row totals of Q*P without materializing the product."""
+        n, m = Q.shape
+        totals = np.zeros(n)
+        for i in prange(n):
+            s = 0.0
+            for j in range(m):
+                s += Q[i, j] * P[i, j]
+            totals[i] = s
+        return totals
+else:
+    def price_rows(Q, P):
+        """Row totals of Q*P."""
+        return np.einsum('ij,ij->i', Q, P)
 
 # Load config
-with open('config.json', 'r') as f:
-    config_data = json.load(f)
+config_data = load_config()
+
+@dataclass(slots=True)
+class Occ:
+    name: str
+    prendas: list
+    price_table: dict  # PRENDA_TYPE -> price_sml_other
 
 # Build a mapping for easier lookup
 class MockUnifiedConfig:
     def __init__(self, data):
         self.occupations = data['occupations']
-        self.synonyms = {}
+        # casefolded synonym -> occupation name
+        self.synonyms = {
+            syn.casefold().strip(): occ['name']
+            for occ in self.occupations
+            for syn in occ['synonyms']
+        }
+        # O(1) lookups; the first occupation/prenda with a given name wins, as with a linear scan
+        self.occ_by_name = {}
         for occ in self.occupations:
-            for syn in occ['synonyms']:
-                self.synonyms[syn.upper().strip()] = occ
+            if occ['name'] in self.occ_by_name:
+                continue
+            price_table = {}
+            for p in occ['prendas']:
+                price_table.setdefault(p['prenda_type'].upper(), p.get('price_sml_other', 0))
+            self.occ_by_name[occ['name']] = Occ(occ['name'], occ['prendas'], price_table)
     
     def normalize_occupation(self, cargo):
-        occ = self.synonyms.get(str(cargo).upper().strip())
-        return occ['name'] if occ else str(cargo).upper()
+        return self.synonyms.get(str(cargo).casefold().strip(), str(cargo).upper())
+
+    def normalize_occupations(self, cargos):
+        """Vectorized normalize_occupation over a CARGO Series."""
+        cargos = cargos.astype('string')
+        names = cargos.str.casefold().str.strip().map(self.synonyms)
+        return names.fillna(cargos.str.upper())
 
     def get_occupation(self, name):
-        for occ in self.occupations:
-            if occ['name'] == name:
-                return occ
-        return None
+        return self.occ_by_name.get(name)
 
 mock_service = MockUnifiedConfig(config_data)
 
 # Load Excel
 file_path = 'sources/pruebitaaaaa uniformes} (2).xlsx'
-df = pd.read_excel(file_path, sheet_name='MIRAFLORES', header=7, engine='openpyxl')
+# Stream the sheet in read-only mode (no style/merged-cell parsing); row 8 holds the headers
+wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+try:
+    rows = wb['MIRAFLORES'].iter_rows(min_row=8, values_only=True)
+    df = pd.DataFrame(rows, columns=list(next(rows)))
+finally:
+    wb.close()
 
 # Identify uniform columns (starting from col J / index 9)
 uniform_cols = df.columns[9:]
@@ -63,60 +112,80 @@ col_mapping = {
     43: "LIMA_ICA_ADMINISTRACION_SACO_H",
 }
 
-print("\n=== Person Analysis ===\n")
-for i, row in df.iterrows():
-    name = row.get('APELLIDOS Y NOMBRES')
-    cargo = row.get('CARGO')
-    if pd.isna(name) or pd.isna(cargo): continue
-    
-    norm_cargo = mock_service.normalize_occupation(cargo)
+# Prenda type per mapped column, resolved once instead of per cell
+PRENDA_TYPE_BY_COL = {i: normalize_prenda_type(name) for i, name in col_mapping.items()}
+
+# Pull the columns out as NumPy arrays once; rows are then plain index reads
+names = df['APELLIDOS Y NOMBRES'].to_numpy()
+cargos = df['CARGO'].to_numpy()
+# Cell values as read, for the report (a float column prints "x2.0", as before)
+cells = df.iloc[:, 9:].to_numpy()
+# Coerce the uniform block once: blanks and text become 0, so "positive" is a plain comparison.
+# float64 keeps the monetary totals as exact as the old per-cell sums
+uni = df.iloc[:, 9:].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64, na_value=0.0)
+positive = uni > 0
+
+# Normalize the whole CARGO column in one pass through the str accessor
+norm_series = mock_service.normalize_occupations(df['CARGO'])
+norm_cargos = norm_series.to_numpy()
+
+# (prenda_type, PRENDA_TYPE, base type after the last "_" or None, BASE_TYPE) for every uniform column
+col_prenda_types = []
+for j in range(uni.shape[1]):
+    prenda_type = PRENDA_TYPE_BY_COL.get(j + 9, f"COL_{j + 9}")
+    base_type = prenda_type.rpartition("_")[2] if "_" in prenda_type else None
+    col_prenda_types.append((prenda_type, prenda_type.upper(), base_type, base_type and base_type.upper()))
+
+def price_columns(norm_cargo):
+    """(label, price) for every uniform column, as seen by one normalized cargo."""
     occ_obj = mock_service.get_occupation(norm_cargo)
-    
-    found_prendas = []
-    total_price = 0
-    
-    # Scan columns
-    for col_idx in range(9, len(row)):
-        val = row.iloc[col_idx]
-        if pd.notna(val) and val != "" and (isinstance(val, (int, float)) and val > 0):
-            col_name = col_mapping.get(col_idx, f"COL_{col_idx}")
-            prenda_type = normalize_prenda_type(col_name)
-            
-            # Lookup price in config
-            price = 0
-            if occ_obj:
-                # Find prenda in occupation
-                # Some prendas in config are "CAMISA", but prenda_type is "SALON_CAMISA" or "CAJA_CAMISA"
-                # This is the likely bug!
-                target = prenda_type
-                # Try to clean it: if it contains a _, take the part after the first _
-                # but only if it matches something
-                # Wait, Produccion has HORNERO, PARRILLERO, etc.
-                # All map to PRODUCCION in config.
-                # In config, Produccion has "PANTALON", "CHAQUETA", etc.
-                # In Excel, MANTENIMIENTO has "MANTENIMIENTO_PANTALON"
-                
-                # Let's see what normalize_prenda_type returns
-                found = False
-                for p in occ_obj['prendas']:
-                    if p['prenda_type'].upper() == prenda_type.upper():
-                        price = p.get('price_sml_other', 0)
-                        found = True
-                        break
-                
-                # Try fallback if not found
-                if not found and "_" in prenda_type:
-                    base_type = prenda_type.split("_")[-1]
-                    for p in occ_obj['prendas']:
-                        if p['prenda_type'].upper() == base_type.upper():
-                            price = p.get('price_sml_other', 0)
-                            found = True
-                            prenda_type = f"{prenda_type} (mapped to {base_type})"
-                            break
-            
-            found_prendas.append(f"{prenda_type} x{val} (@{price})")
-            total_price += price * val
-
-    print(f"[{i+9}] {name[:20]:20} | Cargo: {cargo:15} -> {norm_cargo:15} | Total: {total_price:6.2f}")
+    pricing = []
+    for prenda_type, prenda_upper, base_type, base_upper in col_prenda_types:
+        # Lookup price in config
+        price = 0
+        if occ_obj:
+            # Some prendas in config are "CAMISA", but prenda_type is "SALON_CAMISA" or "CAJA_CAMISA"
+            price_table = occ_obj.price_table
+            if prenda_upper in price_table:
+                price = price_table[prenda_upper]
+            # Try fallback if not found
+            elif base_type is not None:
+                if base_upper in price_table:
+                    price = price_table[base_upper]
+                    prenda_type = f"{prenda_type} (mapped to {base_type})"
+        pricing.append((prenda_type, price))
+    return pricing
+
+# Price matrix P gathered per distinct cargo; rows without a cargo get the trailing zero row
+cargo_codes, cargo_uniques = pd.factorize(norm_series)
+cargo_pricing = {n: price_columns(n) for n in cargo_uniques}
+cargo_prices = np.zeros((len(cargo_uniques) + 1, uni.shape[1]))
+for k, n in enumerate(cargo_uniques):
+    cargo_prices[k] = [price for _, price in cargo_pricing[n]]
+P = cargo_prices[cargo_codes]
+
+# Quantity matrix Q holds only the positive cells, so each row total is one dot product
+Q = np.where(positive, uni, 0.0)
+totals = price_rows(Q, P)
+
+# Buffer the report and write it to stdout once
+buf = io.StringIO()
+buf.write("\n=== Person Analysis ===\n\n")
+# Only rows with both a name and a cargo are reported
+valid_rows = np.flatnonzero((df['APELLIDOS Y NOMBRES'].notna() & df['CARGO'].notna()).to_numpy())
+for i in valid_rows:
+    name = names[i]
+    cargo = cargos[i]
+    norm_cargo = norm_cargos[i]
+    pricing = cargo_pricing[norm_cargo]
+    found_prendas = [(pricing[j][0], cells[i, j], pricing[j][1]) for j in np.flatnonzero(positive[i])]
+    total_price = totals[i]
+
+    # Format only once per row, when it is printed
+    line = f"[{i+9}] {name[:20]:20} | Cargo: {cargo:15} -> {norm_cargo:15} | Total: {total_price:6.2f}"
     if found_prendas:
-        print(f"      Prendas: {', '.join(found_prendas)}")
+        line += "\n      Prendas: " + ", ".join(f"{pt} x{v} (@{pr})" for pt, v, pr in found_prendas)
+    buf.write(line)
+    buf.write("\n")
+
+sys.stdout.write(buf.getvalue())
@@ -3,13 +3,36 @@ Cargos - Uniform Management Application
 
 A GUI application for generating uniform documents from Excel data.
 """
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "Leonardo Candio"
 
-from .core import *
-from .services import *
-from .ui import *
+# Public names and the subpackage providing each one. They are imported on first
+# access (PEP 562) so that touching any cargos module doesn't pull in pandas, docx
+# and tkinter up front.
+_LAZY_EXPORTS = {
+    'AppConfig': 'cargos.core',
+    'ExcelData': 'cargos.core',
+    'WorksheetMetadata': 'cargos.core',
+    'WorksheetParsingResult': 'cargos.core',
+    'ExcelValidationResult': 'cargos.core',
+    'GenerationResult': 'cargos.core',
+    'Prenda': 'cargos.core',
+    'GenerationOptions': 'cargos.core',
+    'OccupationPrenda': 'cargos.core',
+    'Occupation': 'cargos.core',
+    'UnifiedConfig': 'cargos.core',
+    'ExcelService': 'cargos.services',
+    'FileGenerationService': 'cargos.services',
+    'ConfigManager': 'cargos.services',
+    'UnifiedConfigService': 'cargos.services',
+    'CompactFileSelectionFrame': 'cargos.ui',
+    'WorksheetSummaryFrame': 'cargos.ui',
+    'DataPreviewFrame': 'cargos.ui',
+    'CargosTab': 'cargos.ui',
+    'ConfigurationTab': 'cargos.ui',
+}
 
 __all__ = [
     'ExcelService',
@@ -20,3 +43,14 @@ __all__ = [
     'ConfigurationTab',
 ]
 
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -267,17 +267,28 @@ LEGACY_UNIFORM_COLUMN_MAPPING = {
     33: "PRODUCCION_GARIBALDI",
 }
 
-# Build unified column name mapping (LOCATION_OCCUPATION_PRENDA format)
-def _build_uniform_column_mapping():
-    """Build a flat mapping of column index to unified column name."""
-    mapping = {}
-    for location, col_map in LOCATION_COLUMN_MAPPINGS.items():
-        for col_idx, (occupation, prenda) in col_map.items():
-            # Format: LOCATION_OCCUPATION_PRENDA
-            mapping[col_idx] = f"{location}_{occupation}_{prenda}"
-    return mapping
+# Flattened uniform columns (column index, location, occupation, prenda), sorted by column
+_UNIFORM_COLUMNS = sorted(
+    (col_idx, location, occupation, prenda)
+    for location, col_map in LOCATION_COLUMN_MAPPINGS.items()
+    for col_idx, (occupation, prenda) in col_map.items()
+)
 
-UNIFORM_COLUMN_MAPPING = _build_uniform_column_mapping()
+# Unified column name mapping (LOCATION_OCCUPATION_PRENDA format)
+UNIFORM_COLUMN_MAPPING = {
+    col_idx: f"{location}_{occupation}_{prenda}"
+    for col_idx, location, occupation, prenda in _UNIFORM_COLUMNS
+}
+
+def _build_uniform_column_array():
+    """Build a column-indexed tuple of (location, occupation, prenda), None for unmapped columns."""
+    array = [None] * (UNIFORM_DATA_END_COLUMN + 1)
+    for col_idx, location, occupation, prenda in _UNIFORM_COLUMNS:
+        array[col_idx] = (location, occupation, prenda)
+    return tuple(array)
+
+# Same data as UNIFORM_COLUMN_MAPPING, indexed directly by column position
+UNIFORM_COLUMN_ARRAY = _build_uniform_column_array()
 
 # UI constants
 DEFAULT_WINDOW_SIZE = "700x850"
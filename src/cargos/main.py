@@ -6,12 +6,16 @@ Follows clean architecture principles with separation of concerns.
 """
 import tkinter as tk
 from tkinter import ttk
+import atexit
 import logging
+import logging.handlers
+import multiprocessing
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
 from cargos.core.models import ExcelData
-from cargos.services import ExcelService, FileGenerationService, UnifiedConfigService
+from cargos.services.unified_config_service import UnifiedConfigService
 from cargos.ui import CargosTab, ConfigurationTab
 
 
@@ -43,12 +47,7 @@ class FileGeneratorApp:
         self.unified_config_service = UnifiedConfigService(self.logger)
         self.config = self.unified_config_service.get_app_config()
 
-        # Initialize services with logger
-        self.excel_service = ExcelService(self.logger)
-        self.file_generation_service = FileGenerationService(self.logger, self.unified_config_service)
-        
-        # Wire gender prompt callback for ambiguous occupations
-        self._setup_gender_prompt_callback()
+        # Excel and file generation services are created on first use (see the properties below)
 
         # Data storage
         self.excel_data: Optional[ExcelData] = None
@@ -61,36 +60,56 @@ class FileGeneratorApp:
 
         self.logger.info("Application initialized successfully")
     
-    def _setup_gender_prompt_callback(self):
-        """Setup callback for prompting user to select gender for ambiguous occupations."""
+    @cached_property
+    def excel_service(self):
+        """Excel service, imported and created on first use."""
+        from cargos.services.excel_service import ExcelService
+        service = ExcelService(self.logger, self.unified_config_service)
+        service.gender_prompt_callback = self._prompt_gender
+        return service
+
+    @cached_property
+    def file_generation_service(self):
+        """File generation service, imported and created on first use."""
+        from cargos.services.excel_service import FileGenerationService
+        service = FileGenerationService(self.logger, self.unified_config_service)
+        service.gender_prompt_callback = self._prompt_gender
+        return service
+
+    def _prompt_gender(self, person_name: str, cargo: str, male_option: str, female_option: str) -> str:
+        """Prompt the user to select gender for ambiguous occupations."""
         from cargos.ui.ui_components import show_gender_selection_dialog
-        
-        def prompt_gender(person_name: str, cargo: str, male_option: str, female_option: str) -> str:
-            # Get prices for both genders from the price loader
-            # Use male_option to get the true base occupation (e.g., "STAFF ADMINISTRATIVO" from "STAFF ADMINISTRATIVO (HOMBRE)")
-            # This ensures we look up the correct prices in the system
-            cargo_base = male_option.replace('(HOMBRE)', '').replace('(MUJER)', '').strip()
-            
-            # Get gendered prices from the price loader
-            gendered_prices = self.unified_config_service.price_loader.get_gendered_prices(cargo_base, 'LIMA E ICA')
-            
-            return show_gender_selection_dialog(
-                self.root, person_name, cargo, male_option, female_option,
-                male_prices=gendered_prices.get('HOMBRE', {}),
-                female_prices=gendered_prices.get('MUJER', {})
-            )
-        
-        self.excel_service.gender_prompt_callback = prompt_gender
-        self.file_generation_service.gender_prompt_callback = prompt_gender
+
+        # Get prices for both genders from the price loader
+        # Use male_option to get the true base occupation (e.g., "STAFF ADMINISTRATIVO" from "STAFF ADMINISTRATIVO (HOMBRE)")
+        # This ensures we look up the correct prices in the system
+        cargo_base = male_option.replace('(HOMBRE)', '').replace('(MUJER)', '').strip()
+
+        # Get gendered prices from the price loader
+        gendered_prices = self.unified_config_service.price_loader.get_gendered_prices(cargo_base, 'LIMA E ICA')
+
+        return show_gender_selection_dialog(
+            self.root, person_name, cargo, male_option, female_option,
+            male_prices=gendered_prices.get('HOMBRE', {}),
+            female_prices=gendered_prices.get('MUJER', {})
+        )
 
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration."""
         from cargos.core.constants import DEFAULT_LOG_FILE
+        # Buffer log file writes; errors (and a full buffer or exit) flush them to disk
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        file_handler = logging.FileHandler(DEFAULT_LOG_FILE)
+        file_handler.setFormatter(logging.Formatter(log_format))
+        buffered_file_handler = logging.handlers.MemoryHandler(
+            1024, flushLevel=logging.ERROR, target=file_handler
+        )
+        atexit.register(buffered_file_handler.flush)
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler(DEFAULT_LOG_FILE),
+                buffered_file_handler,
                 logging.StreamHandler()
             ]
         )
@@ -231,6 +250,8 @@ class FileGeneratorApp:
             self.logger.error(f"Error saving configuration: {str(e)}")
 
 def main():
+    # Document rendering uses a process pool; needed for the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     root = tk.Tk()
     FileGeneratorApp(root)  # Keep reference to prevent garbage collection
     root.mainloop()
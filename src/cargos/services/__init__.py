@@ -1,12 +1,31 @@
 """Services for Excel processing, file generation, and configuration management."""
-from .excel_service import ExcelService, FileGenerationService
-from .config_manager import ConfigManager
-from .unified_config_service import UnifiedConfigService
+import importlib
+
+# Service name -> defining module, imported on first access (PEP 562)
+_LAZY_EXPORTS = {
+    'ExcelService': 'cargos.services.excel_service',
+    'ExcelLoadError': 'cargos.services.excel_service',
+    'FileGenerationService': 'cargos.services.excel_service',
+    'ConfigManager': 'cargos.services.config_manager',
+    'UnifiedConfigService': 'cargos.services.unified_config_service',
+}
 
 __all__ = [
     'ExcelService',
+    'ExcelLoadError',
     'FileGenerationService',
     'ConfigManager',
     'UnifiedConfigService',
 ]
 
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
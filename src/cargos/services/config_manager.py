@@ -5,76 +5,294 @@ from __future__ import annotations
 
 import json
 import logging
-from pathlib import Path
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path, PureWindowsPath
 from typing import Any, Dict
 
-from cargos.core.models import AppConfig
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is used instead
+    orjson = None
+
+from cargos.core.models import AppConfig, OccupationPrenda
 from cargos.core.constants import DEFAULT_OUTPUT_DIR, DEFAULT_TEMPLATES_DIR, DEFAULT_PREVIEW_ROWS
 
+_LOG = logging.getLogger(__name__)
+
+# OccupationPrenda fields persisted in config.json, in file order
+# (the location-group prices, price_*_lima_ica etc., are not saved)
+_PRENDA_FIELDS = (
+    "prenda_type",
+    "display_name",
+    "has_sizes",
+    "garment_type",
+    "is_required",
+    "default_quantity",
+    "is_primary",
+    "price_sml_other",
+    "price_xl_other",
+    "price_xxl_other",
+    "price_sml_tarapoto",
+    "price_xl_tarapoto",
+    "price_xxl_tarapoto",
+    "price_sml_san_isidro",
+    "price_xl_san_isidro",
+    "price_xxl_san_isidro",
+)
+
+
+def _make_prenda_serializer(fields: tuple) -> Any:
+    """Build ``_serialize_prenda(pr)`` as one straight-line dict literal over fields."""
+    unknown = set(fields) - set(OccupationPrenda.__dataclass_fields__)
+    if unknown:
+        raise AttributeError(f"OccupationPrenda has no field(s) {sorted(unknown)}")
+    items = ", ".join(f"{name!r}: pr.{name}" for name in fields)
+    namespace: Dict[str, Any] = {}
+    exec(compile(f"def _serialize_prenda(pr):\n    return {{{items}}}\n", "<config_manager._serialize_prenda>", "exec"), namespace)
+    return namespace["_serialize_prenda"]
+
+
+_serialize_prenda = _make_prenda_serializer(_PRENDA_FIELDS)
+
+# Files at least this large are parsed from an mmap; below it the mapping costs more than the copy
+_MMAP_THRESHOLD = 64 * 1024
+
+# config.json layout version; 2 stores each occupation's prendas as {"columns", "rows"}
+CONFIG_SCHEMA_VERSION = 2
+
+
+def to_file_layout(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of data with each occupation's prendas stored column-wise.
+
+    An occupation whose prenda dicts don't all share the same keys keeps the
+    plain list, so the conversion is always lossless.
+    """
+    occupations = []
+    for occ in data.get("occupations", []):
+        prendas = occ.get("prendas")
+        if isinstance(prendas, list) and prendas:
+            columns = tuple(prendas[0])
+            if all(tuple(pr) == columns for pr in prendas):
+                occ = {
+                    **occ,
+                    "prendas": {
+                        "columns": list(columns),
+                        "rows": [list(pr.values()) for pr in prendas],
+                    },
+                }
+        occupations.append(occ)
+    return {**data, "occupations": occupations, "schema_version": CONFIG_SCHEMA_VERSION}
+
+
+def from_file_layout(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Expand column-wise prendas back to a list of dicts, in place.
+
+    Occupations still holding a plain list (schema 1 files, or hand-added
+    entries) are left as they are.
+    """
+    for occ in data.get("occupations", []):
+        prendas = occ.get("prendas")
+        if isinstance(prendas, dict):
+            columns = prendas.get("columns", [])
+            occ["prendas"] = [dict(zip(columns, row)) for row in prendas.get("rows", [])]
+    return data
+
+
+# Default app_settings paths, normalized once at import
+_DEFAULT_DESTINATION_PATH = str(Path(f"{DEFAULT_OUTPUT_DIR}/"))
+_DEFAULT_CARGO_TEMPLATE = str(Path(f"{DEFAULT_TEMPLATES_DIR}/CARGO UNIFORMES.docx"))
+_DEFAULT_AUTORIZACION_TEMPLATE = str(
+    Path(f"{DEFAULT_TEMPLATES_DIR}/50% - AUTORIZACIÓN DESCUENTO DE UNIFORMES (02).docx")
+)
+
+
+# Serializing occupations on threads only pays off without the GIL
+_PARALLEL_MIN_OCCUPATIONS = 32
+_SERIALIZER_POOL: ThreadPoolExecutor | None = None
+
+
+def _gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def _serializer_pool() -> ThreadPoolExecutor:
+    global _SERIALIZER_POOL
+    if _SERIALIZER_POOL is None:
+        _SERIALIZER_POOL = ThreadPoolExecutor(thread_name_prefix="config-serialize")
+    return _SERIALIZER_POOL
+
+
+def _settings_path(settings: Dict[str, Any], key: str, default: str) -> str:
+    """Return a saved path as stored (save_config already normalized it), or the default.
+
+    A Windows-style path read on a POSIX system (a config copied between
+    machines) is converted to forward slashes.
+    """
+    value = settings.get(key)
+    if value is None:
+        return default
+    if os.sep == "/" and "\\" in value:
+        return PureWindowsPath(value).as_posix()
+    return value
+
+
+def _serialize_occupations(occupations: list) -> list:
+    """Convert Occupation objects to the plain dicts stored under "occupations"."""
+    if len(occupations) >= _PARALLEL_MIN_OCCUPATIONS and not _gil_enabled():
+        # Free-threaded build: serialize chunks on a thread pool, keeping list order
+        workers = os.cpu_count() or 1
+        size = -(-len(occupations) // workers)
+        chunks = [occupations[i:i + size] for i in range(0, len(occupations), size)]
+        result = []
+        for part in _serializer_pool().map(_serialize_occupation_chunk, chunks):
+            result.extend(part)
+        return result
+    return _serialize_occupation_chunk(occupations)
+
+
+def _serialize_occupation_chunk(occupations: list) -> list:
+    return [
+        {
+            "name": occ.name,
+            "display_name": occ.display_name,
+            "synonyms": occ.synonyms,
+            "prendas": [
+                _serialize_prenda(pr) for pr in occ.prendas
+            ],
+            "is_active": occ.is_active,
+            "description": occ.description,
+        }
+        for occ in occupations
+    ]
+
+
+@dataclass(slots=True)
+class _RawConfig:
+    """Top-level config.json contents; keys this module doesn't know are kept in extra."""
+    app_settings: Dict[str, Any] = field(default_factory=dict)
+    occupations: list = field(default_factory=list)
+    default_occupation: str = "MOZO"
+    default_local_group: str = "OTHER"
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_RawConfig":
+        """Build from a freshly parsed document (which is consumed)."""
+        return cls(
+            data.pop("app_settings", {}),
+            data.pop("occupations", []),
+            data.pop("default_occupation", "MOZO"),
+            data.pop("default_local_group", "OTHER"),
+            data,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "app_settings": self.app_settings,
+            "occupations": self.occupations,
+            "default_occupation": self.default_occupation,
+            "default_local_group": self.default_local_group,
+            **self.extra,
+        }
+
 
 class ConfigManager:
     """Manages persistent configuration settings stored in config.json."""
 
-    def __init__(self, config_file: str | Path | None = None):
+    def __init__(self, config_file: str | Path | None = None, compact: bool = False):
         self.config_file = Path(config_file) if config_file else Path("config.json")
-        self.logger = logging.getLogger(__name__)
+        # compact=True writes without indentation; format_file() re-indents on demand
+        self.compact = compact
+        # Bytes of the file as last read/written, valid while its (mtime_ns, size) is unchanged
+        self._cached_raw: bytes | None = None
+        self._cached_stamp: tuple[int, int] | None = None
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _ensure_structure(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        data.setdefault("app_settings", {})
-        data.setdefault("occupations", [])
-        data.setdefault("default_occupation", "MOZO")
-        data.setdefault("default_local_group", "OTHER")
-        return data
+    def _file_stamp(self) -> tuple[int, int]:
+        stat = self.config_file.stat()
+        return stat.st_mtime_ns, stat.st_size
 
-    def _load_file_data(self) -> Dict[str, Any]:
-        if not self.config_file.exists():
-            return self._ensure_structure({})
+    def _parse_file(self, stamp: tuple[int, int] | None) -> Any:
+        if stamp is not None and stamp == self._cached_stamp:
+            # Unchanged since we last read or wrote it; parsing is cheaper than
+            # copying a cached object, and every caller gets fresh containers
+            raw = self._cached_raw
+        elif orjson is not None and stamp is not None and stamp[1] >= _MMAP_THRESHOLD:
+            # orjson parses straight from the mapped pages, skipping the bytes copy
+            with open(self.config_file, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                return orjson.loads(view)
+        else:
+            raw = self.config_file.read_bytes()
+            self._cached_raw, self._cached_stamp = raw, stamp
+        # Both parsers take the raw UTF-8 bytes, skipping a text-mode decode
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
+    def _load_file_data(self) -> _RawConfig:
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                content = json.load(f)
-            return self._ensure_structure(content)
+            stamp = self._file_stamp()
+        except FileNotFoundError:
+            return _RawConfig()
+        except OSError:
+            stamp = None
+
+        try:
+            return _RawConfig.from_dict(from_file_layout(self._parse_file(stamp)))
         except Exception as error:  # pragma: no cover - defensive
-            self.logger.error(f"Failed to read config file '{self.config_file}': {error}")
-            return self._ensure_structure({})
+            _LOG.error("Failed to read config file '%s': %s", self.config_file, error)
+            return _RawConfig()
 
-    def _write_file_data(self, data: Dict[str, Any]) -> bool:
+    def _encode(self, file_data: Dict[str, Any], indent: bool) -> bytes:
+        if orjson is not None:
+            # orjson always emits UTF-8, matching ensure_ascii=False below
+            return orjson.dumps(file_data, option=orjson.OPT_INDENT_2 if indent else None)
+        if indent:
+            return json.dumps(file_data, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(file_data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def _write_file_data(self, data: _RawConfig, indent: bool | None = None) -> bool:
+        if indent is None:
+            indent = not self.compact
+        # Serialize to bytes in one go and swap the file in atomically, so a failed
+        # write never leaves a truncated config.json behind
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            raw = self._encode(to_file_layout(data.to_dict()), indent)
+            tmp_file.write_bytes(raw)
+            os.replace(tmp_file, self.config_file)
+            # What we just wrote is what the next load would read back
+            self._cached_raw, self._cached_stamp = raw, self._file_stamp()
             return True
         except Exception as error:  # pragma: no cover - defensive
-            self.logger.error(f"Failed to write config file '{self.config_file}': {error}")
+            _LOG.error("Failed to write config file '%s': %s", self.config_file, error)
+            tmp_file.unlink(missing_ok=True)
             return False
 
+    def format_file(self) -> bool:
+        """Rewrite the config file with 2-space indentation for hand editing."""
+        return self._write_file_data(self._load_file_data(), indent=True)
+
     # ------------------------------------------------------------------
     # Application (UI) configuration
     # ------------------------------------------------------------------
     def load_config(self) -> AppConfig:
-        data = self._load_file_data()
-        settings = data.get("app_settings", {})
+        return self._app_config_from(self._load_file_data())
 
-        destination_path = str(
-            Path(settings.get("destination_path", f"{DEFAULT_OUTPUT_DIR}/"))
-        )
-        cargo_template = str(
-            Path(
-                settings.get(
-                    "cargo_template_path",
-                    f"{DEFAULT_TEMPLATES_DIR}/CARGO UNIFORMES.docx",
-                )
-            )
-        )
-        autorizacion_template = str(
-            Path(
-                settings.get(
-                    "autorizacion_template_path",
-                    f"{DEFAULT_TEMPLATES_DIR}/50% - AUTORIZACIÓN DESCUENTO DE UNIFORMES (02).docx",
-                )
-            )
+    def _app_config_from(self, data: _RawConfig) -> AppConfig:
+        settings = data.app_settings
+
+        destination_path = _settings_path(settings, "destination_path", _DEFAULT_DESTINATION_PATH)
+        cargo_template = _settings_path(settings, "cargo_template_path", _DEFAULT_CARGO_TEMPLATE)
+        autorizacion_template = _settings_path(
+            settings, "autorizacion_template_path", _DEFAULT_AUTORIZACION_TEMPLATE
         )
         preview_limit = settings.get("preview_rows_limit", DEFAULT_PREVIEW_ROWS)
 
@@ -88,7 +306,7 @@ class ConfigManager:
     def save_config(self, config: AppConfig, unified_config: Any = None) -> bool:
         data = self._load_file_data()
 
-        data["app_settings"] = {
+        data.app_settings = {
             "destination_path": str(Path(config.destination_path)),
             "cargo_template_path": str(Path(config.cargo_template_path)),
             "autorizacion_template_path": str(Path(config.autorizacion_template_path)),
@@ -96,39 +314,9 @@ class ConfigManager:
         }
 
         if unified_config is not None:
-            data["occupations"] = [
-                {
-                    "name": occ.name,
-                    "display_name": occ.display_name,
-                    "synonyms": occ.synonyms,
-                    "prendas": [
-                        {
-                            "prenda_type": pr.prenda_type,
-                            "display_name": pr.display_name,
-                            "has_sizes": pr.has_sizes,
-                            "garment_type": pr.garment_type,
-                            "is_required": pr.is_required,
-                            "default_quantity": pr.default_quantity,
-                            "is_primary": pr.is_primary,
-                            "price_sml_other": pr.price_sml_other,
-                            "price_xl_other": pr.price_xl_other,
-                            "price_xxl_other": pr.price_xxl_other,
-                            "price_sml_tarapoto": pr.price_sml_tarapoto,
-                            "price_xl_tarapoto": pr.price_xl_tarapoto,
-                            "price_xxl_tarapoto": pr.price_xxl_tarapoto,
-                            "price_sml_san_isidro": pr.price_sml_san_isidro,
-                            "price_xl_san_isidro": pr.price_xl_san_isidro,
-                            "price_xxl_san_isidro": pr.price_xxl_san_isidro,
-                        }
-                        for pr in occ.prendas
-                    ],
-                    "is_active": occ.is_active,
-                    "description": occ.description,
-                }
-                for occ in unified_config.occupations
-            ]
-            data["default_occupation"] = unified_config.default_occupation
-            data["default_local_group"] = unified_config.default_local_group
+            data.occupations = _serialize_occupations(unified_config.occupations)
+            data.default_occupation = unified_config.default_occupation
+            data.default_local_group = unified_config.default_local_group
 
         return self._write_file_data(data)
 
@@ -136,9 +324,16 @@ class ConfigManager:
     # Unified configuration helpers
     # ------------------------------------------------------------------
     def load_unified_config_data(self) -> Dict[str, Any]:
-        data = self._load_file_data()
+        return self._unified_config_data_from(self._load_file_data())
+
+    def _unified_config_data_from(self, data: _RawConfig) -> Dict[str, Any]:
         return {
-            "occupations": data.get("occupations", []),
-            "default_occupation": data.get("default_occupation", "MOZO"),
-            "default_local_group": data.get("default_local_group", "OTHER"),
+            "occupations": data.occupations,
+            "default_occupation": data.default_occupation,
+            "default_local_group": data.default_local_group,
         }
+
+    def load_all(self) -> tuple[AppConfig, Dict[str, Any]]:
+        """Return (load_config(), load_unified_config_data()) from a single file read."""
+        data = self._load_file_data()
+        return self._app_config_from(data), self._unified_config_data_from(data)
@@ -1,10 +1,19 @@
 """
 Service classes for Excel processing and file generation.
 """
+import hashlib
+import os
+import pickle
+import numpy as np
 import pandas as pd
 import logging
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
 from cargos.core.models import ExcelData, GenerationResult, AppConfig, ExcelValidationResult, WorksheetMetadata, WorksheetParsingResult, GenerationOptions
 from cargos.core.validators import TemplateValidator
 from cargos.services.unified_config_service import UnifiedConfigService
@@ -15,27 +24,194 @@ from cargos.core.constants import (
     LOCATION_ROW, OCCUPATION_ROW,
     HEADER_ROW, DATA_START_ROW, IGNORE_COLUMN_INDEX, MAIN_DATA_END_COLUMN,
     UNIFORM_DATA_START_ROW, UNIFORM_DATA_START_COLUMN, UNIFORM_DATA_END_COLUMN,
-    UNIFORM_COLUMN_MAPPING, LOCATION_GROUPS,
+    UNIFORM_COLUMN_ARRAY, LOCATION_GROUPS,
     SPANISH_MONTHS
 )
 
+try:
+    from python_calamine import CalamineWorkbook
+    DEFAULT_EXCEL_ENGINE = "calamine"
+except ImportError:  # pragma: no cover - python-calamine is optional, openpyxl is always installed
+    CalamineWorkbook = None
+    DEFAULT_EXCEL_ENGINE = "openpyxl"
+
+# Parsed worksheets are pickled here, keyed by workbook content and engine; bump the
+# version whenever _parse_worksheet's output changes so stale entries are ignored
+EXCEL_CACHE_DIR = Path.home() / ".cache" / "cargos"
+# Workbook path -> ((mtime_ns, size), content digest), so unchanged files aren't rehashed
+_EXCEL_DIGEST_INDEX = EXCEL_CACHE_DIR / "digests.index"
+_EXCEL_CACHE_VERSION = 3
+_EXCEL_CACHE_MAX_ENTRIES = 20
+
+# Names for the uniform block's columns (J onwards), from UNIFORM_COLUMN_ARRAY;
+# unmapped columns are PRENDA_<offset>
+_UNIFORM_COLUMN_NAMES = tuple(
+    "_".join(entry) if entry is not None else f"PRENDA_{i}"
+    for i, entry in enumerate(
+        UNIFORM_COLUMN_ARRAY[col_idx] if col_idx < len(UNIFORM_COLUMN_ARRAY) else None
+        for col_idx in range(UNIFORM_DATA_START_COLUMN, UNIFORM_DATA_END_COLUMN + 1)
+    )
+)
+
+# Below this many documents per locale, rendering stays in-process
+_PARALLEL_MIN_DOCUMENTS = 8
+
+
+def _render_docx(template_path: str, context: Dict[str, Any], output_docx: Path) -> None:
+    """Render a docx template to output_docx (module-level so worker processes can run it)."""
+    from docxtpl import DocxTemplate
+    tpl = DocxTemplate(template_path)
+    tpl.render(context)
+    tpl.save(str(output_docx))
+
+
+# _parse_quantity result for a uniform cell holding text that is not a number
+_INVALID_QUANTITY = -1
+
+# Strings pd.read_excel treats as missing by default
+_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+class ExcelLoadError(Exception):
+    """Raised by ExcelService.load_excel_file when a workbook cannot be loaded."""
+
+
+def _convert_cell(value: Any) -> Any:
+    """Convert a raw calamine cell the way pandas' calamine reader does."""
+    if isinstance(value, float):
+        if value.is_integer():
+            return int(value)
+    elif isinstance(value, str):
+        if value in _NA_STRINGS:
+            return float("nan")
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def _frame_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Rows of frame as dicts keyed by column label. With duplicate labels the
+    first such column is kept, matching what lookups on a row Series returned.
+    """
+    if not frame.columns.is_unique:
+        frame = frame.loc[:, ~frame.columns.duplicated()]
+    columns = list(frame.columns)
+    if not columns:
+        # itertuples yields nothing without columns; keep one (empty) record per row
+        return [{} for _ in range(len(frame))]
+    return [dict(zip(columns, values)) for values in frame.itertuples(index=False, name=None)]
+
+
+def _as_categories(frame: pd.DataFrame, text_only: bool = False) -> pd.DataFrame:
+    """
+    Store columns as pandas categories, so repeated values (sizes, quantities,
+    cargos) are kept once and each cell is a small integer code. With text_only,
+    only all-text columns where values repeat (at most half distinct) are converted.
+    """
+    for i in range(frame.shape[1]):
+        column = frame.iloc[:, i]
+        if text_only and (pd.api.types.infer_dtype(column, skipna=True) != "string"
+                          or column.nunique() > len(column) // 2):
+            continue
+        frame.isetitem(i, column.astype("category"))
+    return frame
+
+
+def _parse_quantity(value: Any) -> int:
+    """
+    Quantity in a uniform cell: a positive count, 0 for blank/zero/negative
+    cells, or _INVALID_QUANTITY for text that is not a number.
+    """
+    if value is None or pd.isna(value):
+        return 0
+    text = str(value).strip()
+    if text in ('', 'nan', 'NaN', '0'):
+        return 0
+    try:
+        return max(int(float(text)), 0)
+    except (ValueError, TypeError):
+        return _INVALID_QUANTITY
+
+
+def _quantity_matrix(frame: pd.DataFrame) -> Tuple[pd.Index, np.ndarray]:
+    """
+    frame's columns (first of any duplicates, as in _frame_records) and a
+    rows x columns matrix of _parse_quantity results. Each column's distinct
+    values are parsed once and spread over the rows with NumPy, instead of per cell.
+    """
+    if not frame.columns.is_unique:
+        frame = frame.loc[:, ~frame.columns.duplicated()]
+    quantities = np.zeros(frame.shape, dtype=np.int64)
+    for j in range(frame.shape[1]):
+        codes, uniques = pd.factorize(frame.iloc[:, j])
+        # Missing cells get code -1, i.e. the trailing 0
+        parsed = np.array([_parse_quantity(value) for value in uniques] + [0], dtype=np.int64)
+        quantities[:, j] = parsed[codes]
+    return frame.columns, quantities
+
+
+def _quantity_records(columns: pd.Index, quantities: np.ndarray) -> List[Dict[str, int]]:
+    """
+    Per row of a _quantity_matrix, {column: quantity} for the cells with a
+    positive or invalid quantity.
+    """
+    records: List[Dict[str, int]] = [{} for _ in range(len(quantities))]
+    for i, j in zip(*np.nonzero(quantities)):
+        records[i][columns[j]] = int(quantities[i, j])
+    return records
+
+
+def _cell_text(value: Any) -> str:
+    """Cell value as text, with missing cells as ""."""
+    return "" if pd.isna(value) else str(value)
+
+
+def _read_calamine_sheet(workbook: "CalamineWorkbook", sheet_name: str) -> pd.DataFrame:
+    """
+    Read a whole sheet as a header-less DataFrame, equivalent to
+    pd.read_excel(..., header=None) but without pandas' text parser.
+    """
+    rows = workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+    # calamine's grid also spans formatted-but-empty cells; trim trailing empty
+    # rows and columns as the openpyxl reader does, so the sheet has the same shape
+    while rows and all(cell == "" for cell in rows[-1]):
+        rows.pop()
+    width = 0
+    for row in rows:
+        used = len(row)
+        while used > width and row[used - 1] == "":
+            used -= 1
+        width = max(width, used)
+    grid = [[_convert_cell(cell) for cell in row[:width]] for row in rows]
+    # Same per-column dtypes read_excel infers over the full grid
+    return pd.DataFrame(grid, dtype=object).infer_objects()
 
 
 class ExcelService:
     """Service for handling Excel file operations."""
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, unified_service: Optional[UnifiedConfigService] = None):
         self.logger = logger
+        # Used by validate_excel_data to report cargos that need a synonym; without it that check is skipped
+        self.unified_service = unified_service
         # Callback for prompting user to select gender for ambiguous occupations
         # Signature: callback(person_name: str, cargo: str, male_option: str, female_option: str) -> str ('HOMBRE' or 'MUJER')
         self.gender_prompt_callback: Optional[callable] = None
     
-    def load_excel_file(self, file_path: str) -> ExcelData:
+    def load_excel_file(self, file_path: str, engine: Optional[str] = None, use_cache: bool = True) -> ExcelData:
         """
         Load Excel file and parse all worksheets.
         
         Args:
             file_path: Path to the Excel file
+            engine: pandas Excel engine; defaults to calamine (Rust-based, much faster
+                on large workbooks) when python-calamine is installed, else openpyxl
+            use_cache: Reuse the parsed worksheets from EXCEL_CACHE_DIR when the
+                file's contents were loaded before
             
         Returns:
             ExcelData object with parsed worksheets or empty if failed
@@ -49,16 +225,17 @@ class ExcelService:
             
             self.logger.info(f"Loading Excel file: {file_path}")
             
-            # Read all sheets from Excel file
-            with pd.ExcelFile(file_path) as excel_file:
-                sheet_names = excel_file.sheet_names
-                
-                self.logger.info(f"Found {len(sheet_names)} worksheets: {sheet_names}")
-                
-                worksheets = []
-                for sheet_name in sheet_names:
-                    worksheet_result = self._parse_worksheet(excel_file, sheet_name)
-                    worksheets.append(worksheet_result)
+            engine = engine or DEFAULT_EXCEL_ENGINE
+            cache_file = self._cache_file_for(file_path, engine) if use_cache else None
+            worksheets = self._read_cached_worksheets(cache_file) if cache_file else None
+            
+            if worksheets is not None:
+                self.logger.info(f"Reusing parsed worksheets from cache: {cache_file.name}")
+            else:
+                # Read all sheets from Excel file
+                worksheets = list(self.iter_worksheets(file_path, engine))
+                if cache_file:
+                    self._write_cached_worksheets(cache_file, worksheets)
             
             excel_data = ExcelData(
                 file_path=file_path,
@@ -71,15 +248,119 @@ class ExcelService:
             
         except Exception as e:
             error_msg = f"Error loading Excel file: {str(e)}"
-            self.logger.exception(error_msg)
-            raise Exception(error_msg)
+            # The cause is chained onto ExcelLoadError; the caller logs the traceback
+            self.logger.error(error_msg)
+            raise ExcelLoadError(error_msg) from e
+    
+    def iter_worksheets(self, file_path: str, engine: Optional[str] = None) -> Iterator[WorksheetParsingResult]:
+        """
+        Parse worksheets one at a time, yielding each as soon as it is read.
+        
+        Unlike load_excel_file, no sheet is kept once the caller moves on, so
+        only the sheet being processed has its DataFrames in memory.
+        
+        Args:
+            file_path: Path to the Excel file
+            engine: pandas Excel engine, as for load_excel_file
+            
+        Yields:
+            WorksheetParsingResult for each sheet, in workbook order
+        """
+        engine = engine or DEFAULT_EXCEL_ENGINE
+        if engine == "calamine" and CalamineWorkbook is not None:
+            # Open the workbook once and take each sheet's raw grid directly
+            yield from self._parse_worksheets(CalamineWorkbook.from_path(file_path))
+        else:
+            with pd.ExcelFile(file_path, engine=engine) as excel_file:
+                yield from self._parse_worksheets(excel_file)
+    
+    def _cache_file_for(self, file_path: str, engine: str) -> Path:
+        """Cache entry for the workbook's current contents, as parsed by engine."""
+        digest = self._content_digest(file_path)
+        return EXCEL_CACHE_DIR / f"{digest}-{engine}-v{_EXCEL_CACHE_VERSION}.pkl"
     
-    def _parse_worksheet(self, excel_file: pd.ExcelFile, sheet_name: str) -> WorksheetParsingResult:
+    def _content_digest(self, file_path: str) -> str:
+        """
+        Hash of the workbook's bytes. The file is only read and hashed again
+        when its (mtime_ns, size) differs from the last time it was hashed.
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        
+        digests = {}
+        try:
+            with open(_EXCEL_DIGEST_INDEX, 'rb') as f:
+                digests = pickle.load(f)
+            cached_stamp, digest = digests[str(path)]
+            if cached_stamp == stamp:
+                return digest
+        except Exception:
+            pass  # Missing or unreadable index, or a new/changed file
+        
+        digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        digests[str(path)] = (stamp, digest)
+        try:
+            _EXCEL_DIGEST_INDEX.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = _EXCEL_DIGEST_INDEX.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(digests, f, protocol=5)
+            os.replace(tmp_file, _EXCEL_DIGEST_INDEX)
+        except OSError:
+            pass  # Index is best-effort
+        return digest
+    
+    def _read_cached_worksheets(self, cache_file: Path) -> Optional[List[WorksheetParsingResult]]:
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Unreadable entry (e.g. written by another pandas version); parse again
+            self.logger.warning(f"Ignoring Excel cache entry {cache_file.name}: {e}")
+            return None
+    
+    def _write_cached_worksheets(self, cache_file: Path, worksheets: List[WorksheetParsingResult]) -> None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(worksheets, f, protocol=5)
+            os.replace(tmp_file, cache_file)
+            
+            # Keep only the most recently written entries
+            entries = sorted(cache_file.parent.glob('*.pkl'), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+            for old_entry in entries[_EXCEL_CACHE_MAX_ENTRIES:]:
+                old_entry.unlink(missing_ok=True)
+        except Exception as e:  # Cache is best-effort
+            self.logger.warning(f"Could not write Excel cache entry {cache_file.name}: {e}")
+    
+    @staticmethod
+    def _cargo_column(data: Optional[pd.DataFrame]) -> Optional[pd.Series]:
+        """The sheet's CARGO column (header matched case-insensitively), or None."""
+        if data is None:
+            return None
+        for position, column in enumerate(data.columns):
+            if str(column).strip().lower() == 'cargo':
+                return data.iloc[:, position]
+        return None
+    
+    def _parse_worksheets(self, excel_file) -> Iterator[WorksheetParsingResult]:
+        """Parse every worksheet of an open pandas ExcelFile or CalamineWorkbook, lazily."""
+        sheet_names = excel_file.sheet_names
+        
+        self.logger.info(f"Found {len(sheet_names)} worksheets: {sheet_names}")
+        
+        for sheet_name in sheet_names:
+            yield self._parse_worksheet(excel_file, sheet_name)
+    
+    def _parse_worksheet(self, excel_file, sheet_name: str) -> WorksheetParsingResult:
         """
         Parse a single worksheet and extract metadata and data.
         
         Args:
-            excel_file: Pandas ExcelFile object
+            excel_file: Pandas ExcelFile or CalamineWorkbook object
             sheet_name: Name of the sheet to parse
             
         Returns:
@@ -90,35 +371,42 @@ class ExcelService:
         
         try:
             # Read the entire sheet first to extract metadata
-            sheet_data = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+            if isinstance(excel_file, pd.ExcelFile):
+                sheet_data = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+            else:
+                sheet_data = _read_calamine_sheet(excel_file, sheet_name)
+            n_rows, n_cols = sheet_data.shape
             
             # Extract metadata from specific cells
             try:
-                if len(sheet_data) > METADATA_ROW_FECHA_SOLICITUD and len(sheet_data.columns) > METADATA_COL_FECHA_SOLICITUD:
-                    metadata.fecha_solicitud = str(sheet_data.iloc[METADATA_ROW_FECHA_SOLICITUD, METADATA_COL_FECHA_SOLICITUD]) if pd.notna(sheet_data.iloc[METADATA_ROW_FECHA_SOLICITUD, METADATA_COL_FECHA_SOLICITUD]) else ""
+                # One array read for the metadata rows instead of an .iloc lookup per cell
+                head = sheet_data.iloc[:LOCATION_ROW + 1].to_numpy()
+                
+                if n_rows > METADATA_ROW_FECHA_SOLICITUD and n_cols > METADATA_COL_FECHA_SOLICITUD:
+                    metadata.fecha_solicitud = _cell_text(head[METADATA_ROW_FECHA_SOLICITUD, METADATA_COL_FECHA_SOLICITUD])
                 
-                if len(sheet_data) > METADATA_ROW_TIENDA and len(sheet_data.columns) > METADATA_COL_TIENDA:
-                    metadata.tienda = str(sheet_data.iloc[METADATA_ROW_TIENDA, METADATA_COL_TIENDA]) if pd.notna(sheet_data.iloc[METADATA_ROW_TIENDA, METADATA_COL_TIENDA]) else ""
+                if n_rows > METADATA_ROW_TIENDA and n_cols > METADATA_COL_TIENDA:
+                    metadata.tienda = _cell_text(head[METADATA_ROW_TIENDA, METADATA_COL_TIENDA])
                 
-                if len(sheet_data) > METADATA_ROW_ADMINISTRADOR and len(sheet_data.columns) > METADATA_COL_ADMINISTRADOR:
-                    metadata.administrador = str(sheet_data.iloc[METADATA_ROW_ADMINISTRADOR, METADATA_COL_ADMINISTRADOR]) if pd.notna(sheet_data.iloc[METADATA_ROW_ADMINISTRADOR, METADATA_COL_ADMINISTRADOR]) else ""
+                if n_rows > METADATA_ROW_ADMINISTRADOR and n_cols > METADATA_COL_ADMINISTRADOR:
+                    metadata.administrador = _cell_text(head[METADATA_ROW_ADMINISTRADOR, METADATA_COL_ADMINISTRADOR])
                 
                 # Extract location group from LOCATION_ROW (row 6 in Excel = index 5)
                 # This is the first non-empty cell in the location row that contains location group info
-                if len(sheet_data) > LOCATION_ROW:
-                    for col_idx in range(UNIFORM_DATA_START_COLUMN, min(UNIFORM_DATA_END_COLUMN + 1, len(sheet_data.columns))):
-                        cell_value = sheet_data.iloc[LOCATION_ROW, col_idx]
-                        if pd.notna(cell_value) and str(cell_value).strip():
+                if n_rows > LOCATION_ROW:
+                    location_cells = head[LOCATION_ROW, UNIFORM_DATA_START_COLUMN:UNIFORM_DATA_END_COLUMN + 1]
+                    for cell_value in location_cells[pd.notna(location_cells)]:
+                        if str(cell_value).strip():
                             metadata.location_group = str(cell_value).strip()
                             self.logger.info(f"Detected location group: '{metadata.location_group}' in sheet '{sheet_name}'")
                             break
-            except Exception as meta_error:
+            except (IndexError, KeyError, TypeError, ValueError) as meta_error:
                 result.errors.append(f"Error extracting metadata: {str(meta_error)}")
                 self.logger.warning(f"Metadata extraction error in sheet '{sheet_name}': {str(meta_error)}")
             
             # Extract main data (columns B through I) starting from configured row
             try:
-                if len(sheet_data) > DATA_START_ROW:  # Ensure we have data rows
+                if n_rows > DATA_START_ROW:  # Ensure we have data rows
                     # Headers are in HEADER_ROW (row 8 in Excel = index 7)
                     # Data rows start at DATA_START_ROW (row 9 in Excel = index 8)
                     headers = sheet_data.iloc[HEADER_ROW, IGNORE_COLUMN_INDEX + 1:MAIN_DATA_END_COLUMN + 1]
@@ -129,73 +417,61 @@ class ExcelService:
                     
                     if len(main_data_rows) > 0:
                         
-                        # Remove completely empty rows from main data
-                        main_data_rows = main_data_rows.dropna(how='all')
+                        # Rows with any main data; completely empty rows are left out below
+                        # when both frames are sliced once
+                        has_main_data = main_data_rows.notna().to_numpy().any(axis=1)
                         
                         # Check for missing DNI in rows with data
-                        if 'DNI' in main_data_rows.columns or any('dni' in str(col).lower() for col in main_data_rows.columns):
-                            # Find DNI column (case insensitive)
-                            dni_col = None
-                            for col in main_data_rows.columns:
-                                if 'dni' in str(col).lower():
-                                    dni_col = col
-                                    break
+                        # Find DNI column (case insensitive)
+                        dni_col = next((col for col in main_data_rows.columns if 'dni' in str(col).lower()), None)
+                        if dni_col is not None:
+                            missing_dni_count = int((main_data_rows[dni_col].isna().to_numpy() & has_main_data).sum())
                             
-                            if dni_col is not None:
-                                # Check for missing DNI in non-empty rows
-                                non_empty_rows = main_data_rows.dropna(how='all')
-                                missing_dni_count = non_empty_rows[dni_col].isna().sum()
-                                
-                                if missing_dni_count > 0:
-                                    result.errors.append(f"{missing_dni_count} rows with data are missing DNI")
+                            if missing_dni_count > 0:
+                                result.errors.append(f"{missing_dni_count} rows with data are missing DNI")
                         else:
                             result.warnings.append("No DNI column found - cannot validate DNI completeness")
                         
                         # Extract uniform data (columns J-BT, indices 9-71)
                         uniform_data = None
-                        if len(sheet_data) > UNIFORM_DATA_START_ROW:
+                        if n_rows > UNIFORM_DATA_START_ROW:
                             # Determine actual end column (some sheets may have fewer columns)
-                            actual_end_col = min(UNIFORM_DATA_END_COLUMN + 1, len(sheet_data.columns))
+                            actual_end_col = min(UNIFORM_DATA_END_COLUMN + 1, n_cols)
                             uniform_data_rows = sheet_data.iloc[UNIFORM_DATA_START_ROW:, UNIFORM_DATA_START_COLUMN:actual_end_col]
                             
                             # Assign unique column names from mapping, matching actual column count
-                            uniform_column_names = []
-                            actual_col_count = len(uniform_data_rows.columns)
-                            for i in range(actual_col_count):
-                                col_idx = UNIFORM_DATA_START_COLUMN + i
-                                if col_idx in UNIFORM_COLUMN_MAPPING:
-                                    uniform_column_names.append(UNIFORM_COLUMN_MAPPING[col_idx])
-                                else:
-                                    uniform_column_names.append(f"PRENDA_{i}")
-                            
-                            uniform_data_rows.columns = uniform_column_names
+                            uniform_data_rows.columns = _UNIFORM_COLUMN_NAMES[:uniform_data_rows.shape[1]]
                             
-                            # CRITICAL: Join main and uniform data to perform aligned row cleaning
+                            # CRITICAL: Select the same sheet rows from main and uniform data
                             # This prevents uniform data from shifting if an employee has no uniform choices
-                            combined_data = pd.concat([main_data_rows, uniform_data_rows], axis=1)
                             
                             # Drop rows where the person's name or logic identifier is missing
                             # We use APELLIDOS_Y_NOMBRES as it's the most reliable unique identifier for a row
-                            if "APELLIDOS_Y_NOMBRES" in combined_data.columns:
-                                combined_data = combined_data.dropna(subset=["APELLIDOS_Y_NOMBRES"])
+                            if "APELLIDOS_Y_NOMBRES" in main_data_rows.columns:
+                                keep_rows = main_data_rows.index[main_data_rows["APELLIDOS_Y_NOMBRES"].notna().to_numpy()]
                             else:
-                                # Fallback if columns weren't named correctly for some reason
-                                combined_data = combined_data.dropna(how='all')
+                                # Fallback if columns weren't named correctly for some reason:
+                                # keep rows with any main data, then rows with only uniform data
+                                has_uniform_data = uniform_data_rows.notna().to_numpy().any(axis=1)
+                                main_rows = main_data_rows.index[has_main_data]
+                                uniform_only_rows = uniform_data_rows.index[has_uniform_data].difference(main_rows)
+                                keep_rows = main_rows.append(uniform_only_rows)
                             
-                            # Split back into main and uniform data
-                            main_data_rows = combined_data.iloc[:, :len(main_data_rows.columns)]
-                            uniform_data = combined_data.iloc[:, len(main_data_rows.columns):]
+                            main_data_rows = main_data_rows.reindex(keep_rows)
+                            uniform_data = uniform_data_rows.reindex(keep_rows)
                             
-    # Final reset of indices for both
-                            main_data_rows = main_data_rows.reset_index(drop=True)
-                            uniform_data = uniform_data.reset_index(drop=True)
+                            # Final reset of indices for both; both frames are new, so relabel in place
+                            main_data_rows.index = pd.RangeIndex(len(keep_rows))
+                            uniform_data.index = pd.RangeIndex(len(keep_rows))
+                            uniform_data = _as_categories(uniform_data)
                         else:
+                            main_data_rows = main_data_rows[has_main_data]
                             result.warnings.append("Insufficient data for uniform columns")
                         
-                        result.data = main_data_rows
+                        result.data = _as_categories(main_data_rows, text_only=True)
                         result.uniform_data = uniform_data
                         result.people_parsed = len(main_data_rows)  # After cleaning empty rows
-                        result.total_lines = len(sheet_data)  # Total lines in sheet
+                        result.total_lines = n_rows  # Total lines in sheet
                         
                         self.logger.info(f"Sheet '{sheet_name}': {result.people_parsed} people parsed from {result.total_lines} total lines")
                         if uniform_data is not None:
@@ -205,7 +481,7 @@ class ExcelService:
                 else:
                     result.warnings.append(f"Sheet has insufficient rows (less than {DATA_START_ROW + 1})")
                     
-            except Exception as data_error:
+            except (IndexError, KeyError, TypeError, ValueError) as data_error:
                 result.errors.append(f"Error extracting data: {str(data_error)}")
                 self.logger.error(f"Data extraction error in sheet '{sheet_name}': {str(data_error)}")
             
@@ -265,15 +541,20 @@ class ExcelService:
                 result.message = f"All {excel_data.total_worksheets} worksheets failed to parse"
                 return result
             
-            # Check for occupation mapping issues
+            # Check for occupation mapping issues, once per distinct cargo across all sheets
             occupation_mapping_issues = set()
-            for worksheet in excel_data.worksheets:
-                if worksheet.data is not None and 'cargo' in worksheet.data.columns:
-                    for cargo in worksheet.data['cargo'].dropna().unique():
-                        if cargo and str(cargo).strip():
-                            normalized = self.unified_service.normalize_occupation(str(cargo))
-                            if normalized != str(cargo).upper():
-                                occupation_mapping_issues.add(f"'{cargo}' → '{normalized}'")
+            cargo_columns = [
+                cargo_column for worksheet in excel_data.worksheets
+                if (cargo_column := self._cargo_column(worksheet.data)) is not None
+            ]
+            if cargo_columns and self.unified_service is not None:
+                cargos = pd.concat(cargo_columns, ignore_index=True).dropna().astype(str)
+                cargos = pd.Series(cargos[cargos.str.strip() != ""].unique(), dtype=object)
+                normalized = cargos.map(self.unified_service.normalize_occupation)
+                mismatched = (normalized != cargos.str.upper()).to_numpy()
+                occupation_mapping_issues.update(
+                    f"'{cargo}' → '{norm}'" for cargo, norm in zip(cargos[mismatched], normalized[mismatched])
+                )
             
             # Add occupation mapping warnings
             if occupation_mapping_issues:
@@ -304,6 +585,17 @@ class ExcelService:
             return result
 
 
+@dataclass(slots=True)
+class _PersonRowContext:
+    """What a person's AUTORIZACION and CARGO contexts share, worked out once per row."""
+    person_name: str
+    cargo: str  # Gender-resolved cargo; "" when the row has none
+    talla_superior: str
+    prendas: List[Dict[str, Any]]
+    monto: float = 0.0
+    juegos: int = 0
+
+
 class FileGenerationService:
     """Service for generating files from Excel data using templates."""
     
@@ -312,6 +604,15 @@ class FileGenerationService:
         self.unified_service = unified_service
         # Callback for prompting user to select gender for ambiguous occupations
         self.gender_prompt_callback: Optional[callable] = None
+        # Column lookups keyed by a row's column labels (see _lookup_columns / _name_columns)
+        self._lookup_columns_cache: Dict[tuple, List[Any]] = {}
+        self._name_columns_cache: Dict[tuple, tuple] = {}
+        # Column layout -> (male, female) prenda columns (see _gender_columns)
+        self._gender_columns_cache: Dict[tuple, tuple] = {}
+        # Uniform column name -> (prenda_type, display_name, garment_type) (see _prenda_column)
+        self._prenda_columns_cache: Dict[Any, tuple] = {}
+        # Worker processes for docx rendering, alive for one generation run (see _render_pool)
+        self._render_pool_executor: Optional[ProcessPoolExecutor] = None
     
     
     def generate_files(self, excel_data: ExcelData, config: AppConfig, options: Optional[GenerationOptions] = None) -> GenerationResult:
@@ -323,6 +624,31 @@ class FileGenerationService:
             config: Application configuration
             options: Generation options
             
+        Returns:
+            GenerationResult with success status and details
+        """
+        if not excel_data.is_loaded:
+            return GenerationResult(success=False, message="No Excel data loaded")
+        
+        # Set default options if not provided
+        if options is None:
+            options = self._create_default_options(excel_data)
+        
+        return self.generate_files_from_worksheets(excel_data.worksheets, config, options)
+    
+    def generate_files_from_worksheets(self, worksheets: Iterable[WorksheetParsingResult], config: AppConfig, options: GenerationOptions) -> GenerationResult:
+        """
+        Generate files sheet by sheet from an iterable of parsed worksheets.
+        
+        Each sheet's people are rendered before the next sheet is taken, so with
+        ExcelService.iter_worksheets only one sheet's data is alive at a time.
+        Combined documents are built at the end from the accumulated file paths.
+        
+        Args:
+            worksheets: Parsed worksheets, e.g. ExcelService.iter_worksheets(path)
+            config: Application configuration
+            options: Generation options
+            
         Returns:
             GenerationResult with success status and details
         """
@@ -330,31 +656,42 @@ class FileGenerationService:
         
         try:
             # Validate inputs and setup
-            validation_result = self._validate_generation_inputs(excel_data, config, options)
+            validation_result = self._validate_generation_setup(config, options)
             if not validation_result.success:
                 result.message = validation_result.message
                 result.errors.extend(validation_result.errors)
                 return result
             
-            # Set default options if not provided
-            if options is None:
-                options = self._create_default_options(excel_data)
+            dest_path = Path(config.destination_path)
+            files_generated = 0
+            people_per_tienda: Dict[str, int] = {}
+            template_docs_per_tienda: Dict[str, Dict[str, List[Path]]] = {}
             
-            # Group data by locale
-            tienda_to_rows = self._group_data_by_locale(excel_data, options)
-            if not tienda_to_rows:
+            # Group and generate each sheet before parsing/reading the next one
+            for ws in worksheets:
+                tienda, people = self._group_worksheet_data(ws, options)
+                if not people:
+                    continue
+                people_per_tienda[tienda] = people_per_tienda.get(tienda, 0) + len(people)
+                template_docs = template_docs_per_tienda.setdefault(tienda, {})
+                files_generated += self._generate_people_documents(tienda, people, template_docs, dest_path, config)
+            
+            if not people_per_tienda:
                 result.message = "No matching locales or people to generate"
                 return result
             
-            # Generate files
-            files_generated = self._generate_documents(tienda_to_rows, config, options)
+            # Create combined documents if requested
+            if options.combine_per_local:
+                for tienda, template_docs in template_docs_per_tienda.items():
+                    tienda_folder = dest_path / self._sanitize_name(tienda)
+                    files_generated += self._create_combined_documents(template_docs, tienda_folder, tienda)
             
             # Create success result
             result.success = True
             result.files_generated = files_generated
-            total_people = sum(len(people) for people in tienda_to_rows.values())
+            total_people = sum(people_per_tienda.values())
             templates = self._get_enabled_templates(options)
-            result.message = f"Generated {', '.join(templates)} documents for {total_people} people across {len(tienda_to_rows)} locales"
+            result.message = f"Generated {', '.join(templates)} documents for {total_people} people across {len(people_per_tienda)} locales"
             
             self.logger.info(result.message)
             return result
@@ -365,15 +702,13 @@ class FileGenerationService:
             result.message = error_msg
             result.errors.append(error_msg)
             return result
+        finally:
+            self._close_render_pool()
 
-    def _validate_generation_inputs(self, excel_data: ExcelData, config: AppConfig, options: Optional[GenerationOptions]) -> GenerationResult:
-        """Validate inputs for file generation."""
+    def _validate_generation_setup(self, config: AppConfig, options: Optional[GenerationOptions]) -> GenerationResult:
+        """Validate templates, destination and options, independently of the Excel data."""
         result = GenerationResult(success=False)
         
-        if not excel_data.is_loaded:
-            result.message = "No Excel data loaded"
-            return result
-        
         # Validate template files
         template_errors = TemplateValidator.validate_autorizacion_template(config)
         if template_errors:
@@ -428,90 +763,179 @@ class FileGenerationService:
         tienda_to_rows: Dict[str, List[Dict[str, Any]]] = {}
         
         for ws in excel_data.worksheets:
-            tienda = str(ws.metadata.tienda or "").strip()
-            if not tienda or tienda not in options.selected_locales:
-                continue
-            
-            if ws.data is None or ws.data.empty:
-                continue
-            
-            # Skip sheets with critical errors (missing fecha_solicitud, tienda, or DNI errors)
-            # Skip only if tienda is missing (critical for folder structure)
-            if not tienda or tienda.strip() == "":
-                self.logger.warning(f"Sheet '{ws.metadata.sheet_name}' skipped: Missing tienda")
-                continue
-            
-            # Process each person in the worksheet
-            for idx, row in ws.data.iterrows():
-                person_contexts = self._build_person_contexts(row, ws, options)
-                if person_contexts:
-                    tienda_to_rows.setdefault(tienda, []).append(person_contexts)
+            tienda, people = self._group_worksheet_data(ws, options)
+            if people:
+                tienda_to_rows.setdefault(tienda, []).extend(people)
         
         return tienda_to_rows
     
+    def _group_worksheet_data(self, ws, options: GenerationOptions) -> tuple:
+        """Build the person contexts of one worksheet; returns (tienda, people)."""
+        tienda = str(ws.metadata.tienda or "").strip()
+        if not tienda or tienda not in options.selected_locales:
+            return tienda, []
+        
+        if ws.data is None or ws.data.empty:
+            return tienda, []
+        
+        # Process each person in the worksheet, as plain dicts rather than per-row Series
+        people = []
+        uniform_rows = uniform_quantities = uniform_genders = None
+        if self._has_valid_uniform_data(ws):
+            uniform_rows = _frame_records(ws.uniform_data)
+            # Quantities and detected genders for the whole sheet at once
+            columns, quantities = _quantity_matrix(ws.uniform_data)
+            uniform_quantities = _quantity_records(columns, quantities)
+            uniform_genders = self._detect_genders(columns, quantities)
+        for idx, row in enumerate(_frame_records(ws.data)):
+            uniform_row = quantities = gender = None
+            if uniform_rows is not None and idx < len(uniform_rows):
+                uniform_row, quantities, gender = uniform_rows[idx], uniform_quantities[idx], uniform_genders[idx]
+            person_contexts = self._build_person_contexts(row, uniform_row, ws, options, quantities, gender)
+            if person_contexts:
+                people.append(person_contexts)
+        
+        return tienda, people
     
-    
-    def _build_person_contexts(self, row: pd.Series, ws, options: GenerationOptions) -> Dict[str, Any]:
+    def _build_person_contexts(self, row: Dict[str, Any], uniform_row: Optional[Dict[str, Any]], ws, options: GenerationOptions, uniform_quantities: Optional[Dict[str, int]] = None, uniform_gender: Optional[str] = None) -> Dict[str, Any]:
         """Build context dictionaries for a person based on enabled templates."""
         person_contexts = {}
         
-        # Get uniform row for both contexts
-        uniform_row = self._get_uniform_row_for_person(row, ws)
+        try:
+            person = self._compute_row_context(row, ws.metadata, uniform_row, uniform_quantities, uniform_gender)
+        except Exception as e:
+            self.logger.error(f"Error building context: {e}")
+            return person_contexts
         
         if options.autorizacion_enabled:
-            autorizacion_ctx = self._build_autorizacion_context(row, ws.metadata, uniform_row)
+            autorizacion_ctx = self._build_autorizacion_context(row, ws.metadata, person)
             if autorizacion_ctx:
                 person_contexts["AUTORIZACION"] = autorizacion_ctx
-                self.logger.debug(f"Built AUTORIZACION context for {autorizacion_ctx.get('nombre', 'unknown')}")
+                self.logger.debug("Built AUTORIZACION context for %s", autorizacion_ctx.get('nombre', 'unknown'))
             else:
                 self.logger.warning("Failed to build AUTORIZACION context for row")
         
         if options.cargo_enabled:
-            cargo_ctx = self._build_cargo_context(row, ws.metadata, uniform_row)
+            cargo_ctx = self._build_cargo_context(row, ws.metadata, person)
             if cargo_ctx:
                 person_contexts["CARGO"] = cargo_ctx
-                self.logger.debug(f"Built CARGO context for {cargo_ctx.get('nombre', 'unknown')} with {len(cargo_ctx.get('prendas', []))} prendas")
+                self.logger.debug("Built CARGO context for %s with %d prendas", cargo_ctx.get('nombre', 'unknown'), len(cargo_ctx.get('prendas', [])))
             else:
                 self.logger.warning("Failed to build CARGO context for row")
         
         return person_contexts
     
-    def _generate_documents(self, tienda_to_rows: Dict[str, List[Dict[str, Any]]], config: AppConfig, options: GenerationOptions) -> int:
-        """Generate all documents for all locales and people."""
-        dest_path = Path(config.destination_path)
-        files_generated = 0
+    def _compute_row_context(self, row: Dict[str, Any], metadata: WorksheetMetadata, uniform_row: Optional[Dict[str, Any]] = None, uniform_quantities: Optional[Dict[str, int]] = None, uniform_gender: Optional[str] = None) -> _PersonRowContext:
+        """
+        Resolve cargo, prendas, monto and juegos for a person once, for all of their documents.
         
-        for tienda, people in tienda_to_rows.items():
-            tienda_folder = dest_path / self._sanitize_name(tienda)
-            tienda_folder.mkdir(parents=True, exist_ok=True)
-            
-            template_docs: Dict[str, List[Path]] = {}
+        uniform_quantities and uniform_gender are the row's entries from the
+        worksheet-wide _quantity_records and _detect_genders, when available.
+        """
+        person_name = self._extract_name(row)
+        cargo = self._find_in_row(row, ["cargo"]) or ""
+        
+        # Handle gendered occupations - detect gender from prenda columns
+        if cargo and self._is_gendered_occupation(cargo):
+            if uniform_row is None:
+                detected_gender = self._detect_gender_from_row(row)
+            elif uniform_quantities is None:
+                detected_gender = self._detect_gender_from_row(uniform_row)
+            else:
+                # Already detected for the whole worksheet
+                detected_gender = uniform_gender
+            # Store person name for callback context
+            self._current_person_name = person_name
+            cargo = self._resolve_gendered_occupation(cargo, detected_gender)
+        
+        # Build prendas list from uniform data
+        # Use uniform_row if available, otherwise fall back to main row
+        talla_superior = self._extract_talla_superior(row)
+        prendas = self._build_prendas_list(uniform_row if uniform_row is not None else row, talla_superior, uniform_quantities)
+        person = _PersonRowContext(person_name, cargo, talla_superior, prendas)
+        
+        # Get monto (calculated from pricing service)
+        person.monto = self._get_monto_for_person(person, metadata, uniform_row)
+        
+        # Calculate juegos (based on primary prenda or mode of other prendas)
+        try:
+            juegos_value = self._calculate_juegos(person)
+            # Ensure juegos is always an integer (never None)
+            person.juegos = int(juegos_value) if juegos_value is not None else 0
+        except Exception as e:
+            self.logger.error(f"Error calculating juegos: {e}", exc_info=True)
+            person.juegos = 0  # Default to 0 if calculation fails
+        
+        return person
+    
+    def _generate_people_documents(self, tienda: str, people: List[Dict[str, Any]], template_docs: Dict[str, List[Path]], dest_path: Path, config: AppConfig) -> int:
+        """Generate the individual documents of one locale's people, recording their paths in template_docs."""
+        tienda_folder = dest_path / self._sanitize_name(tienda)
+        tienda_folder.mkdir(parents=True, exist_ok=True)
+        
+        # Collect (template_type, template_path, context, docx_path) for each document
+        jobs = []
+        for person_contexts in people:
+            person_name = self._extract_person_name(person_contexts)
+            if not person_name:
+                self.logger.warning("Skipping person with no name")
+                continue
             
-            # Generate individual documents for each person
-            for person_contexts in people:
-                person_name = self._extract_person_name(person_contexts)
-                if not person_name:
-                    self.logger.warning("Skipping person with no name")
-                    continue
-                
-                person_folder = tienda_folder / self._sanitize_name(person_name)
-                person_folder.mkdir(parents=True, exist_ok=True)
-                
-                # Generate documents for each template type
-                for template_type, context in person_contexts.items():
-                    docx_path = self._generate_single_document(
-                        template_type, context, person_folder, config
-                    )
-                    if docx_path:
-                        template_docs.setdefault(template_type, []).append(docx_path)
-                        files_generated += 1
+            person_folder = tienda_folder / self._sanitize_name(person_name)
+            person_folder.mkdir(parents=True, exist_ok=True)
             
-            # Create combined documents if requested
-            if options.combine_per_local:
-                files_generated += self._create_combined_documents(template_docs, tienda_folder, tienda)
+            # One document for each template type
+            for template_type, context in person_contexts.items():
+                job = self._document_job(template_type, context, person_folder, config)
+                if job:
+                    jobs.append(job)
+        
+        files_generated = 0
+        for template_type, docx_path in self._render_documents(jobs):
+            template_docs.setdefault(template_type, []).append(docx_path)
+            files_generated += 1
         
         return files_generated
     
+    def _render_documents(self, jobs: List[tuple]) -> List[tuple]:
+        """
+        Render documents, on a process pool when there are enough of them.
+        
+        Returns (template_type, docx_path) for each document written, in job order.
+        """
+        pool = self._render_pool() if len(jobs) >= _PARALLEL_MIN_DOCUMENTS else None
+        if pool is not None:
+            # Each document goes to its own file, so they render independently
+            futures = [pool.submit(_render_docx, template_path, context, docx_path)
+                       for _, template_path, context, docx_path in jobs]
+        
+        rendered = []
+        for i, (template_type, template_path, context, docx_path) in enumerate(jobs):
+            try:
+                if pool is not None:
+                    futures[i].result()
+                else:
+                    _render_docx(template_path, context, docx_path)
+            except Exception as e:
+                self.logger.error(f"Failed to generate {template_type} document: {e}")
+                continue
+            rendered.append((template_type, docx_path))
+        
+        return rendered
+    
+    def _render_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool for docx rendering, started on first use; None on a single-core machine."""
+        if self._render_pool_executor is None and (os.cpu_count() or 1) > 1:
+            # Spawned rather than forked: the GUI process already runs Tk and threads
+            self._render_pool_executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return self._render_pool_executor
+    
+    def _close_render_pool(self) -> None:
+        """Shut down the rendering workers, if any were started."""
+        if self._render_pool_executor is not None:
+            self._render_pool_executor.shutdown()
+            self._render_pool_executor = None
+    
     def _extract_person_name(self, person_contexts: Dict[str, Any]) -> str:
         """Extract person name from any available context."""
         for context in person_contexts.values():
@@ -519,25 +943,25 @@ class FileGenerationService:
                 return context["nombre"]
         return ""
     
-    def _generate_single_document(self, template_type: str, context: Dict[str, Any], person_folder: Path, config: AppConfig) -> Optional[Path]:
-        """Generate a single document for a person."""
-        try:
-            if template_type == "AUTORIZACION":
-                docx_path = person_folder / f"AUTORIZACION_{self._file_stub(context)}.docx"
-                self.logger.info(f"Generating AUTORIZACION document: {docx_path}")
-                self._render_autorizacion_doc(config.autorizacion_template_path, context, docx_path)
-                return docx_path
-            
-            elif template_type == "CARGO":
-                docx_path = person_folder / f"CARGO_{self._file_stub(context)}.docx"
-                self.logger.info(f"Generating CARGO document: {docx_path}")
-                self._render_cargo_doc(config.cargo_template_path, context, docx_path)
-                return docx_path
-            
-        except Exception as e:
-            self.logger.error(f"Failed to generate {template_type} document: {e}")
+    def _document_job(self, template_type: str, context: Dict[str, Any], person_folder: Path, config: AppConfig) -> Optional[tuple]:
+        """Output path and template for a person's document, as a _render_documents job."""
+        if template_type == "AUTORIZACION":
+            template_path = config.autorizacion_template_path
+        elif template_type == "CARGO":
+            template_path = config.cargo_template_path
+        else:
+            return None
         
-        return None
+        docx_path = person_folder / f"{template_type}_{self._file_stub(context)}.docx"
+        self.logger.info("Generating %s document: %s", template_type, docx_path)
+        # Log context before rendering to verify all variables are present
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Rendering document %s with context keys: %s", docx_path.name, list(context.keys()))
+        if "juegos" in context:
+            self.logger.info("Context includes 'juegos' = %s (type: %s)", context['juegos'], type(context['juegos']))
+        else:
+            self.logger.warning(f"Context does NOT include 'juegos'! Available keys: {list(context.keys())})")
+        return template_type, template_path, context, docx_path
     
     def _create_combined_documents(self, template_docs: Dict[str, List[Path]], tienda_folder: Path, tienda: str) -> int:
         """Create combined documents for each template type."""
@@ -551,7 +975,7 @@ class FileGenerationService:
         
         return files_generated
 
-    def _extract_common_person_data(self, row: pd.Series) -> Dict[str, str]:
+    def _extract_common_person_data(self, row: Dict[str, Any]) -> Dict[str, str]:
         """Extract common person data from a row."""
         return {
             "cargo": self._find_in_row(row, ["cargo"]) or "",
@@ -559,44 +983,26 @@ class FileGenerationService:
             "identificacion": self._find_in_row(row, ["dni"]) or ""
         }
     
-    def _get_uniform_row_for_person(self, row: pd.Series, ws) -> Optional[pd.Series]:
-        """Get uniform row for a person, handling edge cases safely."""
-        if not self._has_valid_uniform_data(ws):
-            return None
-        
-        row_index = row.name if hasattr(row, 'name') else 0
-        if row_index < len(ws.uniform_data):
-            return ws.uniform_data.iloc[row_index]
-        return None
-    
     def _has_valid_uniform_data(self, ws) -> bool:
         """Check if worksheet has valid uniform data."""
         return (ws.uniform_data is not None and 
                 hasattr(ws, 'data') and 
                 len(ws.data) > 0)
     
-    def _calculate_juegos(self, row: pd.Series, metadata: WorksheetMetadata, uniform_row: Optional[pd.Series] = None) -> int:
+    def _calculate_juegos(self, person: _PersonRowContext) -> int:
         """Calculate the juegos value based on primary prenda or mode of other prendas."""
         try:
-            # Get cargo and normalize it
-            cargo = self._find_in_row(row, ["cargo"]) or ""
-            person_name = self._extract_name(row)
-            self._current_person_name = person_name
+            # Cargo was already gender-resolved for the person
+            cargo = person.cargo
+            person_name = person.person_name
             
             if not cargo:
                 self.logger.warning(f"No cargo found for person {person_name}, cannot calculate juegos")
                 return 0
             
-            # Handle gendered occupations - detect gender from prenda columns
-            if self._is_gendered_occupation(cargo):
-                data_row = uniform_row if uniform_row is not None else row
-                detected_gender = self._detect_gender_from_row(data_row)
-                cargo = self._resolve_gendered_occupation(cargo, detected_gender)
-            
             # Normalize cargo using synonyms
             normalized_cargo = self.unified_service.normalize_occupation(cargo)
-            person_name = self._extract_name(row)
-            self.logger.debug(f"Calculating juegos for {person_name}: cargo='{cargo}' -> normalized='{normalized_cargo}'")
+            self.logger.debug("Calculating juegos for %s: cargo='%s' -> normalized='%s'", person_name, cargo, normalized_cargo)
             
             # Get primary prenda for this occupation
             primary_prenda_cfg = self.unified_service.get_primary_prenda(normalized_cargo)
@@ -605,17 +1011,16 @@ class FileGenerationService:
                 return 0
             
             primary_prenda_type = primary_prenda_cfg.prenda_type.upper().strip()
-            self.logger.debug(f"Primary prenda for {normalized_cargo}: {primary_prenda_type}")
-            
-            # Build prendas list (same as in _get_monto_for_person)
-            talla_superior = self._extract_talla_superior(row)
-            prendas = self._build_prendas_list(uniform_row if uniform_row is not None else row, talla_superior)
+            self.logger.debug("Primary prenda for %s: %s", normalized_cargo, primary_prenda_type)
             
+            prendas = person.prendas
             if not prendas:
                 self.logger.warning(f"No prendas found for person {person_name}, cannot calculate juegos")
                 return 0
             
-            self.logger.debug(f"Found {len(prendas)} prendas for {person_name}: {[p.get('prenda_type', '') + ' (qty=' + str(p.get('qty', 0)) + ')' for p in prendas]}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Found %d prendas for %s: %s", len(prendas), person_name,
+                                  [p.get('prenda_type', '') + ' (qty=' + str(p.get('qty', 0)) + ')' for p in prendas])
             
             # Look for primary prenda in the prendas list
             primary_prenda_found = None
@@ -631,12 +1036,12 @@ class FileGenerationService:
                 qty = primary_prenda_found.get("qty", 0)
                 if qty > 0:
                     juegos = int(qty)
-                    self.logger.info(f"Juegos calculated from primary prenda {primary_prenda_type} for {person_name}: {juegos}")
+                    self.logger.info("Juegos calculated from primary prenda %s for %s: %s", primary_prenda_type, person_name, juegos)
                     return juegos
                 else:
-                    self.logger.debug(f"Primary prenda {primary_prenda_type} found but qty=0 for {person_name}, calculating mode of other prendas")
+                    self.logger.debug("Primary prenda %s found but qty=0 for %s, calculating mode of other prendas", primary_prenda_type, person_name)
             else:
-                self.logger.debug(f"Primary prenda {primary_prenda_type} not found in prendas list for {person_name}, calculating mode of other prendas")
+                self.logger.debug("Primary prenda %s not found in prendas list for %s, calculating mode of other prendas", primary_prenda_type, person_name)
             
             # If primary prenda not found or qty = 0, calculate mode of other prendas
             other_quantities = []
@@ -651,29 +1056,18 @@ class FileGenerationService:
                 self.logger.warning(f"No other prendas with qty > 0 found for {person_name}, returning 0 for juegos")
                 return 0
             
-            # Calculate mode (most common value)
-            try:
-                from statistics import mode, StatisticsError
-                juegos = int(mode(other_quantities))
-            except (ImportError, StatisticsError):
-                # Fallback: manual mode calculation
-                from collections import Counter
-                quantity_counts = Counter(other_quantities)
-                # Get the most common value(s)
-                max_count = max(quantity_counts.values())
-                modes = [qty for qty, count in quantity_counts.items() if count == max_count]
-                # If tie, return the highest value
-                juegos = int(max(modes)) if modes else 0
-            
-            self.logger.info(f"Juegos calculated from mode of other prendas for {person_name}: {juegos} (from quantities: {other_quantities})")
+            # Calculate mode (most common value); on a tie the first one seen wins,
+            # as with statistics.mode
+            juegos = int(Counter(other_quantities).most_common(1)[0][0])
+            
+            self.logger.info("Juegos calculated from mode of other prendas for %s: %s (from quantities: %s)", person_name, juegos, other_quantities)
             return juegos
             
         except Exception as e:
-            person_name = self._extract_name(row) if hasattr(self, '_extract_name') else "unknown"
-            self.logger.error(f"Failed to calculate juegos for person {person_name}: {e}", exc_info=True)
+            self.logger.error(f"Failed to calculate juegos for person {person.person_name}: {e}", exc_info=True)
             return 0
     
-    def _build_autorizacion_context(self, row: pd.Series, metadata: WorksheetMetadata, uniform_row: Optional[pd.Series] = None) -> Optional[Dict[str, Any]]:
+    def _build_autorizacion_context(self, row: Dict[str, Any], metadata: WorksheetMetadata, person: _PersonRowContext) -> Optional[Dict[str, Any]]:
         """Build docxtpl context for AUTORIZACION: dia, mes, anho, local, cargo, nombre, identificacion, monto, juegos."""
         try:
             # Parse fecha_solicitud using the same flexible parsing as CARGO
@@ -692,26 +1086,17 @@ class FileGenerationService:
             if dia and mes and anho:
                 fecha_template = f"{dia} / {mes} / {anho}"
             
-            # Get monto (calculated from pricing service)
-            monto_value = self._get_monto_for_person(row, metadata, uniform_row)
-            monto_formatted = f"S/ {monto_value:.2f}"
-            
-            # Calculate juegos (based on primary prenda or mode of other prendas)
-            try:
-                juegos_value = self._calculate_juegos(row, metadata, uniform_row)
-                # Ensure juegos is always an integer (never None)
-                juegos_value = int(juegos_value) if juegos_value is not None else 0
-            except Exception as e:
-                self.logger.error(f"Error calculating juegos: {e}", exc_info=True)
-                juegos_value = 0  # Default to 0 if calculation fails
+            # Monto and juegos were worked out once for the person
+            monto_formatted = f"S/ {person.monto:.2f}"
+            juegos_value = person.juegos
             
             # Debug logging for missing data
             if not person_data["identificacion"]:
-                self.logger.warning(f"No DNI found for person: {person_data['nombre']}. Available columns: {list(row.index)}")
+                self.logger.warning(f"No DNI found for person: {person_data['nombre']}. Available columns: {list(row)}")
             if not person_data["nombre"]:
-                self.logger.warning(f"No nombre found. Available columns: {list(row.index)}")
+                self.logger.warning(f"No nombre found. Available columns: {list(row)}")
             if not person_data["cargo"]:
-                self.logger.warning(f"No cargo found. Available columns: {list(row.index)}")
+                self.logger.warning(f"No cargo found. Available columns: {list(row)}")
             if not fecha_template:
                 self.logger.warning(f"No date found in metadata: {metadata.fecha_solicitud}")
             
@@ -729,16 +1114,18 @@ class FileGenerationService:
             }
             
             # Log the context to verify juegos is included
-            self.logger.info(f"AUTORIZACION context for {person_data['nombre']}: juegos={juegos_value} (type: {type(juegos_value).__name__}), cargo={person_data['cargo']}, local={metadata.tienda}")
-            self.logger.debug(f"Full AUTORIZACION context keys: {list(context.keys())}")
-            self.logger.debug(f"Full AUTORIZACION context: {context}")
+            self.logger.info("AUTORIZACION context for %s: juegos=%s (type: %s), cargo=%s, local=%s",
+                             person_data['nombre'], juegos_value, type(juegos_value).__name__, person_data['cargo'], metadata.tienda)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Full AUTORIZACION context keys: %s", list(context.keys()))
+                self.logger.debug("Full AUTORIZACION context: %s", context)
             
             return context
         except Exception as e:
             self.logger.error(f"Error building context: {e}")
             return None
 
-    def _build_cargo_context(self, row: pd.Series, metadata: WorksheetMetadata, uniform_row: Optional[pd.Series] = None) -> Optional[Dict[str, Any]]:
+    def _build_cargo_context(self, row: Dict[str, Any], metadata: WorksheetMetadata, person: _PersonRowContext) -> Optional[Dict[str, Any]]:
         """Build docxtpl context for CARGO documents with Spanish months and prenda handling."""
         try:
             # Parse fecha_solicitud with flexible date handling
@@ -747,26 +1134,10 @@ class FileGenerationService:
             # Extract common person data
             person_data = self._extract_common_person_data(row)
             
-            # Extract talla prenda superior (second to last row data)
-            talla_superior = self._extract_talla_superior(row)
-            
-            # Build prendas list from uniform data
-            # Use uniform_row if available, otherwise fall back to main row
-            data_row = uniform_row if uniform_row is not None else row
-            prendas = self._build_prendas_list(data_row, talla_superior)
-            
-            # Get monto (calculated from pricing service)
-            monto_value = self._get_monto_for_person(row, metadata, uniform_row)
-            monto_formatted = f"S/ {monto_value:.2f}"
-            
-            # Calculate juegos (based on primary prenda or mode of other prendas)
-            try:
-                juegos_value = self._calculate_juegos(row, metadata, uniform_row)
-                # Ensure juegos is always an integer (never None)
-                juegos_value = int(juegos_value) if juegos_value is not None else 0
-            except Exception as e:
-                self.logger.error(f"Error calculating juegos: {e}", exc_info=True)
-                juegos_value = 0  # Default to 0 if calculation fails
+            # Prendas, monto and juegos were worked out once for the person
+            prendas = person.prendas
+            monto_formatted = f"S/ {person.monto:.2f}"
+            juegos_value = person.juegos
             
             context = {
                 "dia": dia,
@@ -784,27 +1155,6 @@ class FileGenerationService:
             self.logger.error(f"Error building CARGO context: {e}")
             return None
 
-    def _render_autorizacion_doc(self, template_path: str, context: Dict[str, Any], output_docx: Path) -> None:
-        """Render AUTORIZACION document."""
-        self._render_document(template_path, context, output_docx)
-    
-    def _render_cargo_doc(self, template_path: str, context: Dict[str, Any], output_docx: Path) -> None:
-        """Render CARGO document."""
-        self._render_document(template_path, context, output_docx)
-    
-    def _render_document(self, template_path: str, context: Dict[str, Any], output_docx: Path) -> None:
-        """Generic document rendering method."""
-        from docxtpl import DocxTemplate
-        # Log context before rendering to verify all variables are present
-        self.logger.debug(f"Rendering document {output_docx.name} with context keys: {list(context.keys())}")
-        if "juegos" in context:
-            self.logger.info(f"Context includes 'juegos' = {context['juegos']} (type: {type(context['juegos'])})")
-        else:
-            self.logger.warning(f"Context does NOT include 'juegos'! Available keys: {list(context.keys())})")
-        tpl = DocxTemplate(template_path)
-        tpl.render(context)
-        tpl.save(str(output_docx))
-
     def _create_combined_docx(self, individual_docs: List[Path], output_path: Path) -> None:
         """Combine multiple DOCX files into one document with proper formatting using docxcompose."""
         try:
@@ -878,23 +1228,15 @@ class FileGenerationService:
         except Exception as e:
             self.logger.error(f"Failed to create fallback combined document: {e}")
     
-    def _get_monto_for_person(self, row: pd.Series, metadata: WorksheetMetadata, uniform_row: Optional[pd.Series] = None) -> float:
+    def _get_monto_for_person(self, person: _PersonRowContext, metadata: WorksheetMetadata, uniform_row: Optional[Dict[str, Any]] = None) -> float:
         """Get the monto (amount) for a person based on their uniform requirements."""
         try:
-            # Get cargo and normalize it
-            cargo = self._find_in_row(row, ["cargo"]) or ""
+            # Cargo was already gender-resolved for the person
+            cargo = person.cargo
             if not cargo:
                 self.logger.warning("No cargo found for person, using default pricing")
                 cargo = "MOZO"  # Default cargo
             
-            # Handle gendered occupations - detect gender from prenda columns
-            if self._is_gendered_occupation(cargo):
-                data_row = uniform_row if uniform_row is not None else row
-                detected_gender = self._detect_gender_from_row(data_row)
-                # Store person name for callback context
-                self._current_person_name = self._extract_name(row)
-                cargo = self._resolve_gendered_occupation(cargo, detected_gender)
-            
             # Normalize cargo using synonyms
             normalized_cargo = self.unified_service.normalize_occupation(cargo)
             
@@ -918,17 +1260,17 @@ class FileGenerationService:
                 occupation_obj = self.unified_service.get_occupation(normalized_cargo)
                 if occupation_obj and occupation_obj.prendas:
                     first_prenda = occupation_obj.prendas[0]
-                    self.logger.info(f"✓ Occupation: '{normalized_cargo}' (sample: {first_prenda.display_name} S/{first_prenda.price_sml_other})")
+                    self.logger.info("✓ Occupation: '%s' (sample: %s S/%s)", normalized_cargo, first_prenda.display_name, first_prenda.price_sml_other)
             
             # Get local/tienda
             local = metadata.tienda or "OTHER"
             
-            # Build prendas list for pricing calculation
-            talla_superior = self._extract_talla_superior(row)
-            prendas = self._build_prendas_list(uniform_row if uniform_row is not None else row, talla_superior)
+            # Prendas for pricing calculation
+            talla_superior = person.talla_superior
+            prendas = person.prendas
             
             # Debug: log detailed information for PACKER and MOTORIZADO
-            person_name = self._extract_name(row)
+            person_name = person.person_name
             if normalized_cargo in ['PACKER', 'MOTORIZADO'] or 'PACKER' in cargo.upper() or 'MOTORIZADO' in cargo.upper():
                 self.logger.info(f"DEBUG PACKER/MOTORIZADO - {person_name}:")
                 self.logger.info(f"  Original cargo: '{cargo}'")
@@ -937,8 +1279,8 @@ class FileGenerationService:
                 self.logger.info(f"  Talla superior: '{talla_superior}'")
                 self.logger.info(f"  Uniform row available: {uniform_row is not None}")
                 if uniform_row is not None:
-                    self.logger.info(f"  Uniform row columns: {list(uniform_row.index)}")
-                    self.logger.info(f"  Uniform row values: {uniform_row.to_dict()}")
+                    self.logger.info(f"  Uniform row columns: {list(uniform_row)}")
+                    self.logger.info(f"  Uniform row values: {uniform_row}")
                 self.logger.info(f"  Found {len(prendas)} prendas:")
                 for i, prenda in enumerate(prendas):
                     self.logger.info(f"    {i+1}. {prenda}")
@@ -948,12 +1290,13 @@ class FileGenerationService:
                 prendas, normalized_cargo, local, local_group=metadata.location_group
             )
             
-            self.logger.info(f"Calculated monto for {person_name}: "
-                           f"Cargo={normalized_cargo}, Local={local}, Prendas={len(prendas)}, Total={total_price}")
+            self.logger.info("Calculated monto for %s: Cargo=%s, Local=%s, Prendas=%d, Total=%s",
+                             person_name, normalized_cargo, local, len(prendas), total_price)
             
             # Debug: log individual prenda prices
-            for prenda in prendas:
-                self.logger.debug(f"  Prenda: {prenda['string']}, Qty: {prenda['qty']}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for prenda in prendas:
+                    self.logger.debug("  Prenda: %s, Qty: %s", prenda['string'], prenda['qty'])
             
             return total_price
             
@@ -971,21 +1314,21 @@ class FileGenerationService:
         fecha_string = f"{dia} de {mes_string} de {anho}"
         return dia, mes_string, anho, fecha_string
     
-    def _extract_talla_superior(self, row: pd.Series) -> str:
+    def _extract_talla_superior(self, row: Dict[str, Any]) -> str:
         """Extract talla prenda superior from row data."""
         # Look for talla-related columns (second to last priority)
         talla_keys = ["talla prenda superior", "talla superior", "talla", "size", "talla_superior"]
         talla = self._find_in_row(row, talla_keys) or ""
         return str(talla).strip().upper()
     
-    def _extract_talla_inferior(self, row: pd.Series) -> str:
+    def _extract_talla_inferior(self, row: Dict[str, Any]) -> str:
         """Extract talla prenda inferior from row data."""
         # Look for talla inferior columns
         talla_keys = ["talla prenda inferior", "talla inferior", "talla_inferior"]
         talla = self._find_in_row(row, talla_keys) or ""
         return str(talla).strip().upper()
     
-    def _get_talla_for_garment(self, row: pd.Series, garment_type: str) -> str:
+    def _get_talla_for_garment(self, row: Dict[str, Any], garment_type: str) -> str:
         """Get the appropriate talla based on garment type (UPPER or LOWER)."""
         if garment_type == "LOWER":
             # Try to get talla inferior first
@@ -1008,61 +1351,61 @@ class FileGenerationService:
         # Everything else defaults to UPPER (shirts, jackets, aprons, etc.)
         return "UPPER"
     
-    def _build_prendas_list(self, row: pd.Series, talla_superior: str) -> List[Dict[str, Any]]:
-        """Build list of prendas from uniform data with quantities."""
+    def _build_prendas_list(self, row: Dict[str, Any], talla_superior: str, quantities: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+        """
+        Build list of prendas from uniform data with quantities.
+        
+        quantities is the row's entry from _quantity_records when the row comes
+        from a worksheet's uniform data; otherwise the row's cells are parsed here.
+        """
         prendas = []
+        if quantities is None:
+            quantities = {column_name: qty for column_name, value in row.items() if (qty := _parse_quantity(value))}
         
         # Enhanced approach: Check all uniform columns dynamically
         uniform_columns = self._get_uniform_columns_from_row(row)
         
         for column_name in uniform_columns:
-            qty_value = row[column_name]
-            
-            # Handle Series values (from duplicate column names)
-            if isinstance(qty_value, pd.Series):
-                qty_value = qty_value.iloc[0] if len(qty_value) > 0 else None
-            
-            # Check if we have a valid quantity value (not NaN, not empty, not zero)
-            if (qty_value is not None and 
-                pd.notna(qty_value) and 
-                str(qty_value).strip() not in ['', 'nan', 'NaN', '0']):
-                try:
-                    qty = int(float(str(qty_value).strip()))
-                    if qty > 0:
-                        # Normalize column name to prenda type
-                        prenda_type = self._normalize_prenda_type(column_name)
-                        display_name = self._get_display_name(prenda_type)
-                        
-                        # Determine garment type and get appropriate talla
-                        garment_type = self._determine_garment_type(prenda_type)
-                        talla = self._get_talla_for_garment(row, garment_type)
-                        
-                        # Use the determined talla (not just talla_superior)
-                        if not talla:
-                            talla = talla_superior  # Fallback to talla_superior if not found
-                        
-                        # Create formatted prenda string for display
-                        prenda_string = self._format_prenda_string(display_name, talla)
-                        
-                        prenda_dict = {
-                            "string": prenda_string,
-                            "qty": qty,
-                            "prenda_type": prenda_type,
-                            "garment_type": garment_type,
-                            "talla": talla
-                        }
-                        prendas.append(prenda_dict)
-                        
-                except (ValueError, TypeError):
-                    # Only log warning for truly invalid values, not NaN/empty
-                    if str(qty_value).strip() not in ['', 'nan', 'NaN']:
-                        self.logger.warning(f"Invalid quantity value for {column_name}: {qty_value}")
-                    continue
+            # Only cells with a valid quantity or invalid text are in quantities
+            qty = quantities.get(column_name, 0)
+            if qty == _INVALID_QUANTITY:
+                self.logger.warning(f"Invalid quantity value for {column_name}: {row[column_name]}")
+            elif qty > 0:
+                # Prenda type, display name and garment type of the column
+                prenda_type, display_name, garment_type = self._prenda_column(column_name)
+                
+                # Get appropriate talla for the garment type
+                talla = self._get_talla_for_garment(row, garment_type)
+                
+                # Use the determined talla (not just talla_superior)
+                if not talla:
+                    talla = talla_superior  # Fallback to talla_superior if not found
+                
+                # Create formatted prenda string for display
+                prenda_string = self._format_prenda_string(display_name, talla)
+                
+                prenda_dict = {
+                    "string": prenda_string,
+                    "qty": qty,
+                    "prenda_type": prenda_type,
+                    "garment_type": garment_type,
+                    "talla": talla
+                }
+                prendas.append(prenda_dict)
         prendas = self._apply_business_rules(prendas, row)
         
         return prendas
     
-    def _apply_business_rules(self, prendas: List[Dict[str, Any]], row: pd.Series) -> List[Dict[str, Any]]:
+    def _prenda_column(self, column_name: Any) -> tuple:
+        """(prenda_type, display_name, garment_type) for a uniform column, worked out once per column name."""
+        spec = self._prenda_columns_cache.get(column_name)
+        if spec is None:
+            prenda_type = self._normalize_prenda_type(column_name)
+            spec = (prenda_type, self._get_display_name(prenda_type), self._determine_garment_type(prenda_type))
+            self._prenda_columns_cache[column_name] = spec
+        return spec
+    
+    def _apply_business_rules(self, prendas: List[Dict[str, Any]], row: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Apply business rules to prendas list.
         
         Rules:
@@ -1115,7 +1458,7 @@ class FileGenerationService:
         
         return prendas
     
-    def _detect_gender_from_row(self, row: pd.Series) -> Optional[str]:
+    def _detect_gender_from_row(self, row: Dict[str, Any]) -> Optional[str]:
         """Detect gender from prenda columns.
         
         Returns:
@@ -1123,31 +1466,11 @@ class FileGenerationService:
             'MUJER' - if female-specific prendas found (BLUSA, SACO_M)
             None - if gender cannot be determined
         """
-        # Check for male indicators
-        male_indicators = ['CAMISA', 'SACO_H', 'SACO H']
-        female_indicators = ['BLUSA', 'SACO_M', 'SACO M']
+        male_columns, female_columns = self._gender_columns(row)
         
-        has_male = False
-        has_female = False
-        
-        for col in row.index:
-            col_upper = str(col).upper()
-            value = row[col]
-            
-            # Check if column has a positive quantity
-            has_value = False
-            if pd.notna(value):
-                try:
-                    qty = int(float(str(value).strip()))
-                    has_value = qty > 0
-                except (ValueError, TypeError):
-                    pass
-            
-            if has_value:
-                if any(ind in col_upper for ind in male_indicators):
-                    has_male = True
-                elif any(ind in col_upper for ind in female_indicators):
-                    has_female = True
+        # Check if any column of each kind has a positive quantity
+        has_male = any(_parse_quantity(row[col]) > 0 for col in male_columns)
+        has_female = any(_parse_quantity(row[col]) > 0 for col in female_columns)
         
         if has_male and not has_female:
             return 'HOMBRE'
@@ -1155,6 +1478,38 @@ class FileGenerationService:
             return 'MUJER'
         return None
     
+    def _detect_genders(self, columns: pd.Index, quantities: np.ndarray) -> List[Optional[str]]:
+        """_detect_gender_from_row for every row of a _quantity_matrix at once."""
+        male_columns, female_columns = self._gender_columns(columns)
+        positive = quantities > 0
+        has_male = positive[:, columns.get_indexer(male_columns)].any(axis=1)
+        has_female = positive[:, columns.get_indexer(female_columns)].any(axis=1)
+        genders = np.full(len(quantities), None, dtype=object)
+        genders[has_male & ~has_female] = 'HOMBRE'
+        genders[has_female & ~has_male] = 'MUJER'
+        return genders.tolist()
+    
+    def _gender_columns(self, row: Dict[str, Any]) -> tuple:
+        """
+        (male, female) lists of the row's gender-specific prenda columns. A column
+        matching both kinds counts as male. Computed once per column layout.
+        """
+        cache_key = tuple(row)
+        columns = self._gender_columns_cache.get(cache_key)
+        if columns is None:
+            # Check for male indicators
+            male_indicators = ['CAMISA', 'SACO_H', 'SACO H']
+            female_indicators = ['BLUSA', 'SACO_M', 'SACO M']
+            male_columns, female_columns = [], []
+            for col in row:
+                col_upper = str(col).upper()
+                if any(ind in col_upper for ind in male_indicators):
+                    male_columns.append(col)
+                elif any(ind in col_upper for ind in female_indicators):
+                    female_columns.append(col)
+            columns = self._gender_columns_cache[cache_key] = (male_columns, female_columns)
+        return columns
+    
     def _is_gendered_occupation(self, cargo: str) -> bool:
         """Check if occupation name is ambiguous/gendered (contains (A) or similar)."""
         cargo_upper = cargo.upper().strip()
@@ -1225,12 +1580,12 @@ class FileGenerationService:
         # If no pattern matched, return as-is
         return cargo
     
-    def _get_uniform_columns_from_row(self, row: pd.Series) -> List[str]:
+    def _get_uniform_columns_from_row(self, row: Dict[str, Any]) -> List[str]:
         """Get all uniform-related columns from a row dynamically."""
         uniform_columns = []
         
         # Get all columns that could be uniform data
-        for col in row.index:
+        for col in row:
             col_str = str(col).lower().strip()
             
             # Skip empty or non-uniform columns
@@ -1370,71 +1725,64 @@ class FileGenerationService:
         else:
             return f"{display_name} TALLA {talla_superior}"
 
-    def _find_in_row(self, row: pd.Series, keys: List[str]) -> Optional[str]:
+    def _find_in_row(self, row: Dict[str, Any], keys: List[str]) -> Optional[str]:
         """Find a value in a row by searching for column names that contain any of the specified keys."""
-        lowered = {str(k).lower(): k for k in row.index}
-        
-        # First try exact matches
-        for needle in keys:
-            if needle.lower() in lowered:
-                val = row[lowered[needle.lower()]]
-                # Handle Series values (from duplicate column names)
-                if isinstance(val, pd.Series):
-                    val = val.iloc[0] if len(val) > 0 else None
-                if pd.notna(val) and str(val).strip():
-                    return str(val).strip()
-        
-        # Then try partial matches
-        for key in lowered:
-            for needle in keys:
-                if needle.lower() in key:
-                    val = row[lowered[key]]
-                    # Handle Series values (from duplicate column names)
-                    if isinstance(val, pd.Series):
-                        val = val.iloc[0] if len(val) > 0 else None
-                    if pd.notna(val) and str(val).strip():
-                        return str(val).strip()
-        
+        for column in self._lookup_columns(row, keys):
+            val = row[column]
+            if pd.notna(val) and str(val).strip():
+                return str(val).strip()
         return None
+    
+    def _lookup_columns(self, row: Dict[str, Any], keys: List[str]) -> List[Any]:
+        """
+        Columns _find_in_row checks for keys, in order: exact (case-insensitive)
+        matches first, then partial matches. Rows of a worksheet share their
+        columns, so the list is computed once per column layout.
+        """
+        cache_key = (tuple(row), tuple(keys))
+        columns = self._lookup_columns_cache.get(cache_key)
+        if columns is None:
+            lowered = {str(k).lower(): k for k in row}
+            needles = [needle.lower() for needle in keys]
+            columns = [lowered[needle] for needle in needles if needle in lowered]
+            columns += [lowered[key] for key in lowered for needle in needles if needle in key]
+            self._lookup_columns_cache[cache_key] = columns
+        return columns
 
-    def _extract_name(self, row: pd.Series) -> str:
-        lowered = {str(k).lower(): k for k in row.index}
-        combined = None
-        for key in lowered:
-            if "nombre" in key and "apellido" in key:
-                combined = row[lowered[key]]
-                # Handle Series values (from duplicate column names)
-                if isinstance(combined, pd.Series):
-                    combined = combined.iloc[0] if len(combined) > 0 else None
-                break
+    def _extract_name(self, row: Dict[str, Any]) -> str:
+        combined_cols, first_cols, last_cols = self._name_columns(row)
+        combined = row[combined_cols[0]] if combined_cols else None
         if pd.notna(combined) and str(combined).strip():
             return str(combined).strip()
-        first = None
-        last = None
-        for key in lowered:
-            if first is None and ("nombre" in key or "name" in key):
-                first = row[lowered[key]]
-                # Handle Series values (from duplicate column names)
-                if isinstance(first, pd.Series):
-                    first = first.iloc[0] if len(first) > 0 else None
-            if last is None and ("apellido" in key or "last" in key):
-                last = row[lowered[key]]
-                # Handle Series values (from duplicate column names)
-                if isinstance(last, pd.Series):
-                    last = last.iloc[0] if len(last) > 0 else None
+        first = next((row[col] for col in first_cols if row[col] is not None), None)
+        last = next((row[col] for col in last_cols if row[col] is not None), None)
         name = ""
         if pd.notna(first):
             name = str(first).strip()
         if pd.notna(last):
             name = (name + " " + str(last).strip()).strip()
         return name
+    
+    def _name_columns(self, row: Dict[str, Any]) -> tuple:
+        """(full name, first name, last name) candidate columns for _extract_name, cached per column layout."""
+        cache_key = tuple(row)
+        columns = self._name_columns_cache.get(cache_key)
+        if columns is None:
+            lowered = {str(k).lower(): k for k in row}
+            columns = (
+                [lowered[key] for key in lowered if "nombre" in key and "apellido" in key][:1],
+                [lowered[key] for key in lowered if "nombre" in key or "name" in key],
+                [lowered[key] for key in lowered if "apellido" in key or "last" in key],
+            )
+            self._name_columns_cache[cache_key] = columns
+        return columns
 
-    def _get_uniform_columns_from_row(self, row: pd.Series) -> List[str]:
+    def _get_uniform_columns_from_row(self, row: Dict[str, Any]) -> List[str]:
         """
         Get relevant uniform columns for this row based on occupation group.
         This prevents 'cross-talk' where an employee in one role gets items from another column group.
         """
-        all_columns = [col for col in row.index if col not in ['apellidos_y_nombres', 'dni', 'cargo', 'fecha_ingrese', 
+        all_columns = [col for col in row if col not in ['apellidos_y_nombres', 'dni', 'cargo', 'fecha_ingrese', 
                                                              'talla_zapato', 'talla_pantalon', 'talla_prenda_superior']]
         
         # Get cargo from row
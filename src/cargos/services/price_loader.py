@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Dict, Optional, Any
 from datetime import datetime
 
-import pandas as pd
-
 
 # Material name to prenda_type mapping
 MATERIAL_TO_PRENDA: Dict[str, str] = {
@@ -127,6 +125,8 @@ class PriceLoader:
     
     def load_from_excel(self, excel_path: str) -> bool:
         """Load prices from Excel Precios sheet."""
+        import pandas as pd  # Only needed here; keeps pandas out of GUI startup
+        
         try:
             path = Path(excel_path)
             if not path.exists():
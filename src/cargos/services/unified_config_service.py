@@ -23,14 +23,26 @@ class UnifiedConfigService:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.config_manager = ConfigManager()
-        self.unified_config = self._load_config()
+        # App settings and occupations come from one read; the first get_app_config() reuses it
+        self._startup_app_config, data = self.config_manager.load_all()
+        self.unified_config = self._load_config(data)
+        # Bumped by every occupation/prenda edit; save() only re-serializes occupations
+        # when it differs from the revision last loaded or written
+        self._revision = 0
+        self._saved_revision = 0
+        # Lookup caches, cleared whenever the occupations change:
+        # cargo -> normalize_occupation(cargo), and upper-cased name -> occupation/primary prenda
+        self._normalized_occupations: Dict[str, str] = {}
+        self._occupations_by_name: Dict[str, Optional[Occupation]] = {}
+        self._primary_prendas: Dict[str, Optional[OccupationPrenda]] = {}
         
         # Initialize price loader - try cache first, then Excel
         self.price_loader = PriceLoader(logger)
         self._load_prices()
 
-    def _load_config(self) -> UnifiedConfig:
-        data = self.config_manager.load_unified_config_data()
+    def _load_config(self, data: Optional[Dict] = None) -> UnifiedConfig:
+        if data is None:
+            data = self.config_manager.load_unified_config_data()
         occupations: List[Occupation] = []
 
         for occ_data in data.get("occupations", []):
@@ -74,7 +86,7 @@ class UnifiedConfigService:
                 Occupation(
                     name=occ_data["name"],
                     display_name=occ_data.get("display_name", occ_data["name"]),
-                    synonyms=occ_data.get("synonyms", []),
+                    synonyms=list(occ_data.get("synonyms", [])),
                     prendas=prendas,
                     is_active=occ_data.get("is_active", True),
                     description=occ_data.get("description", ""),
@@ -90,18 +102,39 @@ class UnifiedConfigService:
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
+    def _mark_changed(self) -> None:
+        self._revision += 1
+        self._clear_lookup_caches()
+    
+    def _clear_lookup_caches(self) -> None:
+        self._normalized_occupations.clear()
+        self._occupations_by_name.clear()
+        self._primary_prendas.clear()
+
     def save(self, config: Optional[AppConfig] = None, unified_config: Optional[UnifiedConfig] = None) -> bool:
         if config is None:
             config = self.config_manager.load_config()
         if unified_config is not None:
             self.unified_config = unified_config
-        return self.config_manager.save_config(config, self.unified_config)
+            self._mark_changed()
+        # Unchanged occupations are already on disk; only app settings need merging then
+        revision = self._revision
+        changed = revision != self._saved_revision
+        saved = self.config_manager.save_config(config, self.unified_config if changed else None)
+        if saved:
+            self._saved_revision = revision
+        return saved
 
     def reload(self) -> UnifiedConfig:
         self.unified_config = self._load_config()
+        self._saved_revision = self._revision
+        self._clear_lookup_caches()
         return self.unified_config
 
     def get_app_config(self) -> AppConfig:
+        if self._startup_app_config is not None:
+            config, self._startup_app_config = self._startup_app_config, None
+            return config
         return self.config_manager.load_config()
     
     def _load_prices(self) -> bool:
@@ -139,21 +172,25 @@ class UnifiedConfigService:
     # ------------------------------------------------------------------
     def get_occupation(self, name: str) -> Optional[Occupation]:
         name_upper = name.upper().strip()
+        if name_upper in self._occupations_by_name:
+            return self._occupations_by_name[name_upper]
+        found = None
         for occupation in self.unified_config.occupations:
-            if occupation.name.upper() == name_upper:
-                return occupation
-            for synonym in occupation.synonyms:
-                if synonym.upper() == name_upper:
-                    return occupation
-        return None
+            if occupation.name.upper() == name_upper or any(synonym.upper() == name_upper for synonym in occupation.synonyms):
+                found = occupation
+                break
+        self._occupations_by_name[name_upper] = found
+        return found
 
     def get_primary_prenda(self, occupation_name: str) -> Optional[OccupationPrenda]:
         """Get the primary prenda for an occupation (used for juegos calculation)."""
+        name_upper = occupation_name.upper().strip()
+        if name_upper in self._primary_prendas:
+            return self._primary_prendas[name_upper]
         occupation = self.get_occupation(occupation_name)
-        if not occupation:
-            return None
         # Find the prenda with is_primary=True
-        primary_prenda = next((p for p in occupation.prendas if p.is_primary), None)
+        primary_prenda = next((p for p in occupation.prendas if p.is_primary), None) if occupation else None
+        self._primary_prendas[name_upper] = primary_prenda
         return primary_prenda
 
     def get_occupation_synonyms(self, occupation_name: str) -> List[str]:
@@ -161,8 +198,13 @@ class UnifiedConfigService:
         return occupation.synonyms if occupation else [occupation_name]
 
     def normalize_occupation(self, cargo: str) -> str:
-        occupation = self.get_occupation(cargo)
-        return occupation.name if occupation else cargo.upper()
+        # The same few cargo strings are normalized for every person of a workbook
+        normalized = self._normalized_occupations.get(cargo)
+        if normalized is None:
+            occupation = self.get_occupation(cargo)
+            normalized = occupation.name if occupation else cargo.upper()
+            self._normalized_occupations[cargo] = normalized
+        return normalized
 
     def calculate_total_price(self, prendas: List[Dict], cargo: str, local: str, local_group: Optional[str] = None) -> float:
         """
@@ -268,6 +310,7 @@ class UnifiedConfigService:
             return False
         
         self.unified_config.occupations.append(occupation)
+        self._mark_changed()
         return True
 
     def update_occupation(self, occupation: Occupation) -> bool:
@@ -275,6 +318,7 @@ class UnifiedConfigService:
         for i, occ in enumerate(self.unified_config.occupations):
             if occ.name == occupation.name:
                 self.unified_config.occupations[i] = occupation
+                self._mark_changed()
                 return True
         return False
 
@@ -284,6 +328,7 @@ class UnifiedConfigService:
             occ for occ in self.unified_config.occupations 
             if occ.name != occupation_name
         ]
+        self._mark_changed()
         return True
 
     def add_prenda_to_occupation(self, occupation_name: str, prenda: OccupationPrenda) -> bool:
@@ -299,6 +344,7 @@ class UnifiedConfigService:
             return False
         
         occupation.prendas.append(prenda)
+        self._mark_changed()
         return True
 
     def update_prenda_in_occupation(self, occupation_name: str, prenda: OccupationPrenda) -> bool:
@@ -311,6 +357,7 @@ class UnifiedConfigService:
         for i, p in enumerate(occupation.prendas):
             if p.prenda_type == prenda.prenda_type:
                 occupation.prendas[i] = prenda
+                self._mark_changed()
                 return True
         
         self.logger.warning(f"Prenda {prenda.prenda_type} not found in {occupation_name}")
@@ -324,6 +371,7 @@ class UnifiedConfigService:
             return False
         
         occupation.prendas = [p for p in occupation.prendas if p.prenda_type != prenda_type]
+        self._mark_changed()
         return True
 
     def add_synonym_to_occupation(self, occupation_name: str, synonym: str) -> bool:
@@ -336,6 +384,7 @@ class UnifiedConfigService:
         synonym_upper = synonym.upper().strip()
         if synonym_upper not in occupation.synonyms:
             occupation.synonyms.append(synonym_upper)
+            self._mark_changed()
             return True
         
         self.logger.warning(f"Synonym {synonym} already exists in {occupation_name}")
@@ -351,6 +400,7 @@ class UnifiedConfigService:
         synonym_upper = synonym.upper().strip()
         if synonym_upper in occupation.synonyms:
             occupation.synonyms.remove(synonym_upper)
+            self._mark_changed()
             return True
         
         return False
@@ -393,6 +443,7 @@ class UnifiedConfigService:
             # Create new prenda with this price
             new_prenda = OccupationPrenda(prenda_type=prenda_type)
             occupation.prendas.append(new_prenda)
+            self._mark_changed()
             prenda = new_prenda
             self.logger.info(f"Created new prenda {prenda_type} in {occupation_name}")
         
@@ -417,6 +468,7 @@ class UnifiedConfigService:
         # Check if attribute exists
         if hasattr(prenda, price_attr):
             setattr(prenda, price_attr, price)
+            self._mark_changed()
             self.logger.debug(f"Updated {occupation_name}/{prenda_type} {price_attr} = {price}")
             return True
         else:
@@ -5,7 +5,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from typing import Callable, Optional, List
 from datetime import datetime
-import pandas as pd
+# pandas is imported inside the methods that use it, so starting the GUI doesn't load it
 
 from cargos.core.models import ExcelData, AppConfig, Occupation, OccupationPrenda
 from cargos.core.constants import (
@@ -597,6 +597,7 @@ class DataPreviewFrame:
     
     def _populate_uniform_data(self, worksheet, columns):
         """Populate the uniform data treeview with actual data."""
+        import pandas as pd
         main_df = worksheet.data
         uniform_df = worksheet.uniform_data if worksheet.uniform_data is not None else None
         
@@ -635,6 +636,7 @@ class DataPreviewFrame:
     
     def _extract_name_and_cargo(self, series):
         """Extract name and cargo from a pandas Series."""
+        import pandas as pd
         name_val = ""
         cargo_val = ""
         lowered = {str(k).lower(): k for k in series.index}
@@ -698,6 +700,7 @@ class DataPreviewFrame:
     
     def _safe_int_conversion(self, value, default=None):
         """Safely convert a value to integer with fallback."""
+        import pandas as pd
         if value is None or (isinstance(value, float) and pd.isna(value)):
             return default
         
@@ -794,6 +797,7 @@ class DataPreviewFrame:
     
     def _to_scalar(self, value):
         """Convert pandas Series to scalar value (handles duplicate column names)."""
+        import pandas as pd
         if isinstance(value, pd.Series):
             # Choose first non-null value
             for v in value.values:
@@ -807,6 +811,7 @@ class DataPreviewFrame:
     
     def _format_date_only(self, value):
         """Format date value to show only date part (no time)."""
+        import pandas as pd
         if value is None or (isinstance(value, float) and pd.isna(value)):
             return ""
         
@@ -820,6 +825,7 @@ class DataPreviewFrame:
     
     def _format_cell_value(self, val):
         """Format a cell value for display in the treeview."""
+        import pandas as pd
         try:
             return "" if pd.isna(val) else str(val)
         except Exception:
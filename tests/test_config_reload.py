@@ -0,0 +1,28 @@
+"""Unsaved occupation edits must not leak into the ConfigManager cache."""
+import json
+import logging
+
+from cargos.services.unified_config_service import UnifiedConfigService
+
+
+def _write_config(path):
+    path.write_text(json.dumps({
+        "app_settings": {},
+        "occupations": [
+            {"name": "MOZO", "display_name": "Mozo", "synonyms": ["MESERO"], "prendas": []},
+        ],
+    }), encoding="utf-8")
+
+
+def test_reload_drops_unsaved_synonym(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_config(tmp_path / "config.json")
+    service = UnifiedConfigService(logging.getLogger(__name__))
+
+    assert service.add_synonym_to_occupation("MOZO", "CAMARERO")
+    service.reload()
+
+    assert service.get_occupation("MOZO").synonyms == ["MESERO"]
+    service.save()
+    saved = json.loads((tmp_path / "config.json").read_text(encoding="utf-8"))
+    assert "CAMARERO" not in json.dumps(saved)
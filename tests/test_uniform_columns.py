@@ -0,0 +1,37 @@
+"""Sheets with fewer than 10 columns have an empty (column-less) uniform block."""
+import json
+import logging
+
+import pandas as pd
+
+from cargos.core.models import GenerationOptions, WorksheetMetadata, WorksheetParsingResult
+from cargos.services.excel_service import FileGenerationService
+from cargos.services.unified_config_service import UnifiedConfigService
+
+
+def test_narrow_sheet_has_no_prendas(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.json").write_text(json.dumps({
+        "app_settings": {},
+        "occupations": [{"name": "MOZO", "display_name": "Mozo", "synonyms": [], "prendas": []}],
+    }), encoding="utf-8")
+    logger = logging.getLogger(__name__)
+    service = FileGenerationService(logger, UnifiedConfigService(logger))
+
+    data = pd.DataFrame({
+        "DNI": ["12345678", "87654321"],
+        "APELLIDOS Y NOMBRES": ["PEREZ JUAN", "DIAZ ANA"],
+        "CARGO": ["MOZO", "MOZO"],
+        "PRECIO": [106.5, 20],
+    })
+    ws = WorksheetParsingResult(
+        metadata=WorksheetMetadata("Descuentos", tienda="MIRAFLORES"),
+        data=data,
+        uniform_data=data.iloc[:, 9:],
+    )
+
+    tienda, people = service._group_worksheet_data(ws, GenerationOptions(selected_locales=["MIRAFLORES"]))
+
+    assert tienda == "MIRAFLORES"
+    assert len(people) == 2
+    assert all(person["CARGO"]["prendas"] == [] for person in people)
@@ -2,7 +2,7 @@
 Price Verification Script - Compare prices from precios.xlsm with config.json
 """
 import pandas as pd
-import json
+from config_index import load_config
 
 # Load prices from Excel
 print("Loading precios.xlsm...")
@@ -11,8 +11,7 @@ excel_prices = df[['GRUPO', 'CARGO ESTANDAR', 'MATERIAL', 'TALLA', 'Precio Unit'
 
 # Load config.json
 print("Loading config.json...")
-with open('config.json', 'r') as f:
-    config = json.load(f)
+config = load_config()
 
 print("\n=== ALL PRICES FROM precios.xlsm ===\n")
 excel_prices_sorted = excel_prices.sort_values(['GRUPO', 'CARGO ESTANDAR', 'MATERIAL'])